@@ -89,7 +89,8 @@ async def readiness(
     """
     try:
         if supabase_client:
-            await supabase_client.get_pending_count()
+            # 캐시된 값이 아닌 실제 DB 조회로 연결 상태 확인
+            await supabase_client.get_pending_count(max_age=0)
         return {"status": "ready"}
     except Exception as e:
         return {"status": "not_ready", "error": str(e)}
@@ -48,6 +48,7 @@ def _get_validator() -> MappingValidator:
         _validator = MappingValidator(_get_mapping_loader())
     return _validator
 
+
 router = APIRouter(
     prefix="/api/v1/render",
     tags=["Render"],
@@ -70,9 +71,7 @@ router = APIRouter(
 )
 async def submit_render(
     request: RenderRequest,
-    validate_mapping: bool = Query(
-        True, description="매핑 검증 수행 여부 (기본: True)"
-    ),
+    validate_mapping: bool = Query(True, description="매핑 검증 수행 여부 (기본: True)"),
     supabase_client: Any = Depends(get_supabase_client),
     config_store: Any = Depends(get_config_store),
 ) -> RenderResponse:
@@ -124,15 +123,11 @@ async def submit_render(
             warnings.extend(result.warnings)
 
             if result.fallback_fields:
-                warnings.append(
-                    f"Fallback fields (no mapping): {result.fallback_fields}"
-                )
+                warnings.append(f"Fallback fields (no mapping): {result.fallback_fields}")
 
             if result.errors:
                 # 에러는 경고로 기록 (현재 정책: 차단 없음)
-                logger.warning(
-                    f"[Render] Validation errors (not blocking): {result.errors}"
-                )
+                logger.warning(f"[Render] Validation errors (not blocking): {result.errors}")
                 warnings.extend(result.errors)
 
             if warnings:
@@ -182,7 +177,8 @@ async def submit_render(
     position = None
     if supabase_client:
         try:
-            position = await supabase_client.get_pending_count()
+            # 방금 추가한 작업이 반영되도록 캐시 미사용
+            position = await supabase_client.get_pending_count(max_age=0)
         except Exception:
             pass
 
@@ -203,9 +199,7 @@ async def submit_render(
 )
 async def submit_batch_render(
     request: RenderBatchRequest,
-    validate_mapping: bool = Query(
-        True, description="매핑 검증 수행 여부 (기본: True)"
-    ),
+    validate_mapping: bool = Query(True, description="매핑 검증 수행 여부 (기본: True)"),
     supabase_client: Any = Depends(get_supabase_client),
     config_store: Any = Depends(get_config_store),
 ) -> RenderBatchResponse:
@@ -266,9 +260,7 @@ async def submit_batch_render(
     description="렌더링 작업 목록을 조회합니다. 필터링 및 페이지네이션을 지원합니다.",
 )
 async def list_renders(
-    status_filter: RenderStatus | None = Query(
-        None, alias="status", description="상태 필터"
-    ),
+    status_filter: RenderStatus | None = Query(None, alias="status", description="상태 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     supabase_client: Any = Depends(get_supabase_client),
@@ -12,7 +12,7 @@ from .errors import (
     ErrorClassifier,
     NexrenderError,
 )
-from .job_builder import JobConfig, NexrenderJobBuilder
+from .job_builder import AssetIndex, JobConfig, NexrenderJobBuilder
 from .mapping_loader import MappingLoader, extract_template_name
 from .path_utils import PathConverter, PathMapping
 from .types import (
@@ -39,6 +39,7 @@ __all__ = [
     "NON_RETRYABLE_PATTERNS",
     "RETRYABLE_PATTERNS",
     # Job Builder
+    "AssetIndex",
     "JobConfig",
     "NexrenderJobBuilder",
     # Mapping Loader
@@ -9,21 +9,30 @@ Nexrender API 클라이언트 (비동기/동기)
 """
 
 import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator
 from typing import Any, Callable
 
 import httpx
 
 from .errors import NexrenderError
+from .json_utils import dumps
 
 logger = logging.getLogger(__name__)
 
+# 커넥션 풀 설정 (세션 재사용 시 keep-alive 연결 유지)
+_POOL_LIMITS = httpx.Limits(max_connections=100, keepalive_expiry=60.0)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class NexrenderClient:
     """비동기 Nexrender API 클라이언트
 
-    Note: Celery 워커 호환성을 위해 httpx.AsyncClient를 캐싱하지 않음
-    (각 이벤트 루프에서 새로운 클라이언트 생성)
+    Note: Celery 워커 호환성을 위해 기본적으로 httpx.AsyncClient를 캐싱하지 않음
+    (각 이벤트 루프에서 새로운 클라이언트 생성).
+    단일 이벤트 루프에서 동작하는 워커는 open_session()으로 연결을 재사용할 수 있음.
     """
 
     def __init__(
@@ -37,6 +46,7 @@ class NexrenderClient:
         self.secret = secret
         self.timeout = timeout
         self.max_retries = max_retries
+        self._session: httpx.AsyncClient | None = None
 
     def _create_client(self) -> httpx.AsyncClient:
         """새로운 HTTP 클라이언트 생성 (매 요청마다)"""
@@ -48,11 +58,32 @@ class NexrenderClient:
             base_url=self.base_url,
             headers=headers,
             timeout=self.timeout,
+            limits=_POOL_LIMITS,
         )
 
+    def open_session(self) -> None:
+        """요청 간 재사용할 HTTP 클라이언트 생성
+
+        폴링 요청마다 TCP 연결을 새로 맺지 않도록 keep-alive 연결을 유지합니다.
+        close() 호출 전까지 같은 이벤트 루프에서만 사용해야 합니다.
+        """
+        if self._session is None:
+            self._session = self._create_client()
+
+    @contextlib.asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """요청용 HTTP 클라이언트 (세션이 열려 있으면 재사용, 없으면 1회용)"""
+        if self._session is not None:
+            yield self._session
+        else:
+            async with self._create_client() as client:
+                yield client
+
     async def close(self) -> None:
-        """클라이언트 종료 (호환성용, 실제로는 no-op)"""
-        pass
+        """클라이언트 종료 (open_session()으로 연 세션이 없으면 no-op)"""
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.aclose()
 
     async def health_check(self) -> bool:
         """Nexrender 서버 헬스 체크
@@ -61,7 +92,7 @@ class NexrenderClient:
             bool: 서버 정상 여부
         """
         try:
-            async with self._create_client() as client:
+            async with self._client() as client:
                 response = await client.get("/api/v1/jobs")
                 return response.status_code == 200
         except httpx.HTTPError as e:
@@ -81,8 +112,10 @@ class NexrenderClient:
             NexrenderError: 작업 제출 실패
         """
         try:
-            async with self._create_client() as client:
-                response = await client.post("/api/v1/jobs", json=job_data)
+            async with self._client() as client:
+                response = await client.post(
+                    "/api/v1/jobs", content=dumps(job_data), headers=_JSON_HEADERS
+                )
                 response.raise_for_status()
                 return response.json()
         except httpx.HTTPStatusError as e:
@@ -105,7 +138,7 @@ class NexrenderClient:
             NexrenderError: 작업 조회 실패
         """
         try:
-            async with self._create_client() as client:
+            async with self._client() as client:
                 response = await client.get(f"/api/v1/jobs/{job_uid}")
                 response.raise_for_status()
                 return response.json()
@@ -128,7 +161,7 @@ class NexrenderClient:
             NexrenderError: 목록 조회 실패
         """
         try:
-            async with self._create_client() as client:
+            async with self._client() as client:
                 response = await client.get("/api/v1/jobs")
                 response.raise_for_status()
                 return response.json()
@@ -146,7 +179,7 @@ class NexrenderClient:
             bool: 취소 성공 여부
         """
         try:
-            async with self._create_client() as client:
+            async with self._client() as client:
                 response = await client.delete(f"/api/v1/jobs/{job_uid}")
                 return response.status_code in (200, 204)
         except httpx.HTTPError as e:
@@ -237,7 +270,9 @@ class NexrenderSyncClient:
         """
         try:
             with self._create_client() as client:
-                response = client.post("/api/v1/jobs", json=job_data)
+                response = client.post(
+                    "/api/v1/jobs", content=dumps(job_data), headers=_JSON_HEADERS
+                )
                 response.raise_for_status()
                 return response.json()
         except httpx.HTTPStatusError as e:
@@ -4,8 +4,17 @@
 재시도 가능 여부를 자동으로 판단하여 워커 재시도 로직에 활용.
 """
 
+import functools
+import re
+import traceback
+from collections.abc import Callable, Iterable
 from enum import Enum
 
+try:
+    import ahocorasick  # pyahocorasick (선택적 의존성)
+except ImportError:
+    ahocorasick = None
+
 
 class ErrorCategory(str, Enum):
     """에러 카테고리"""
@@ -45,6 +54,26 @@ NON_RETRYABLE_PATTERNS = [
 ]
 
 
+def _build_matcher(patterns: list[str]) -> Callable[[str], bool]:
+    """패턴 중 하나라도 포함되는지 검사하는 함수 생성 (메시지당 1회 스캔)
+
+    pyahocorasick 설치 시 오토마톤, 없으면 사전 컴파일된 정규식 alternation 사용
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern.lower(), pattern)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+
+    regex = re.compile("|".join(re.escape(p) for p in patterns), re.IGNORECASE)
+    return lambda text: regex.search(text) is not None
+
+
+_match_retryable = _build_matcher(RETRYABLE_PATTERNS)
+_match_non_retryable = _build_matcher(NON_RETRYABLE_PATTERNS)
+
+
 class NexrenderError(Exception):
     """Nexrender 기본 에러"""
 
@@ -53,6 +82,34 @@ class NexrenderError(Exception):
         self.category = category
 
 
+# 카테고리 → 메시지 라벨
+_CATEGORY_LABELS = {
+    ErrorCategory.RETRYABLE: "[재시도 가능]",
+    ErrorCategory.NON_RETRYABLE: "[재시도 불가]",
+    ErrorCategory.UNKNOWN: "[분류되지 않음]",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_cached(error_type: type[BaseException], error_str: str) -> ErrorCategory:
+    """(예외 타입, 메시지) 기반 분류 (결과 캐시)"""
+    # 패턴 매칭 (우선순위: NON_RETRYABLE > RETRYABLE)
+    if _match_non_retryable(error_str):
+        return ErrorCategory.NON_RETRYABLE
+
+    if _match_retryable(error_str):
+        return ErrorCategory.RETRYABLE
+
+    # 예외 타입 기반 분류
+    if issubclass(error_type, (TimeoutError, ConnectionError, OSError)):
+        return ErrorCategory.RETRYABLE
+
+    if issubclass(error_type, (ValueError, KeyError, FileNotFoundError)):
+        return ErrorCategory.NON_RETRYABLE
+
+    return ErrorCategory.UNKNOWN
+
+
 class ErrorClassifier:
     """에러 분류기"""
 
@@ -60,31 +117,41 @@ class ErrorClassifier:
     def classify(cls, error: Exception) -> ErrorCategory:
         """에러를 분류하여 카테고리 반환
 
+        NexrenderError에 카테고리가 명시된 경우 그대로 사용하고,
+        그 외에는 (예외 타입, 메시지) 기준으로 캐시된 분류 결과를 반환합니다.
+
         Args:
             error: 분류할 예외 객체
 
         Returns:
             ErrorCategory: 재시도 가능 여부에 따른 카테고리
         """
-        error_str = str(error).lower()
+        if isinstance(error, NexrenderError) and error.category != ErrorCategory.UNKNOWN:
+            return error.category
 
-        # 패턴 매칭 (우선순위: NON_RETRYABLE > RETRYABLE)
-        for pattern in NON_RETRYABLE_PATTERNS:
-            if pattern.lower() in error_str:
-                return ErrorCategory.NON_RETRYABLE
+        return _classify_cached(type(error), str(error))
 
-        for pattern in RETRYABLE_PATTERNS:
-            if pattern.lower() in error_str:
-                return ErrorCategory.RETRYABLE
+    @classmethod
+    def classify_many(cls, messages: Iterable[str]) -> list[ErrorCategory]:
+        """저장된 에러 메시지 일괄 분류 (통계/재분류용)
 
-        # 예외 타입 기반 분류
-        if isinstance(error, (TimeoutError, ConnectionError, OSError)):
-            return ErrorCategory.RETRYABLE
+        예외 객체 없이 메시지 문자열만으로 패턴 매칭하며,
+        배치 내 중복 메시지는 한 번만 분류합니다.
 
-        if isinstance(error, (ValueError, KeyError, FileNotFoundError)):
-            return ErrorCategory.NON_RETRYABLE
+        Args:
+            messages: 에러 메시지 목록 (예: render_queue.error_message)
 
-        return ErrorCategory.UNKNOWN
+        Returns:
+            list[ErrorCategory]: 입력 순서와 동일한 카테고리 목록
+        """
+        seen: dict[str, ErrorCategory] = {}
+        categories = []
+        for message in messages:
+            category = seen.get(message)
+            if category is None:
+                category = seen[message] = _classify_cached(Exception, message)
+            categories.append(category)
+        return categories
 
     @classmethod
     def format_message(cls, error: Exception, include_traceback: bool = False) -> str:
@@ -98,17 +165,11 @@ class ErrorClassifier:
             str: 카테고리 라벨이 포함된 에러 메시지
         """
         category = cls.classify(error)
-        label = {
-            ErrorCategory.RETRYABLE: "[재시도 가능]",
-            ErrorCategory.NON_RETRYABLE: "[재시도 불가]",
-            ErrorCategory.UNKNOWN: "[분류되지 않음]",
-        }
-
-        message = f"{label[category]} {type(error).__name__}: {str(error)}"
+        message = f"{_CATEGORY_LABELS[category]} {type(error).__name__}: {str(error)}"
 
         if include_traceback:
-            import traceback
-
-            message += f"\n\n상세 정보:\n{traceback.format_exc()}"
+            # 예외 자체의 __traceback__ 사용 (except 블록 밖에서 포맷해도 동일 결과)
+            details = "".join(traceback.format_exception(error))
+            message += f"\n\n상세 정보:\n{details}"
 
         return message
@@ -11,16 +11,27 @@ Nexrender Job JSON 빌더
 - 매핑이 없으면 GFX 필드명을 그대로 layerName으로 사용 (fallback)
 """
 
-from dataclasses import dataclass
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
-from .mapping_loader import MappingLoader, extract_template_name
+from .mapping_loader import MappingLoader, extract_template_name, slot_field_prefix
 from .path_utils import PathConverter
 
+# 출력 포맷 → 파일 확장자 (미등록 포맷은 mp4)
+_OUTPUT_EXTENSIONS = {
+    "mp4": "mp4",
+    "mov": "mov",
+    "mov_alpha": "mov",
+    "png_sequence": "png",
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class JobConfig:
-    """Job 빌드 설정"""
+    """Job 빌드 설정 (불변)"""
 
     aep_project_path: str
     composition_name: str
@@ -28,6 +39,84 @@ class JobConfig:
     output_dir: str = ""
     output_filename: str = ""
     callback_url: str | None = None
+    # output_format에서 파생 (생성 시 1회 계산)
+    output_ext: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # frozen이므로 파생 필드는 object.__setattr__로 설정
+        ext = _OUTPUT_EXTENSIONS.get(self.output_format.lower(), "mp4")
+        object.__setattr__(self, "output_ext", ext)
+
+
+class AssetIndex:
+    """Job JSON의 assets 조회 인덱스
+
+    빌더가 반환한 Job을 받아 첫 조회 시점에 인덱스를 생성합니다.
+    빌더는 빌드 간 상태를 갖지 않으므로 Job마다 인덱스를 따로 만듭니다.
+
+    Example:
+        job = builder.build_from_gfx_data(gfx_data, job_id)
+        images = AssetIndex(job).get_assets_by_type("image")
+    """
+
+    def __init__(self, job: dict[str, Any]):
+        """
+        Args:
+            job: Nexrender Job JSON (assets 포함)
+        """
+        self.assets: list[dict[str, Any]] = job.get("assets", [])
+
+    @cached_property
+    def _type_index(self) -> dict[str, list[int]]:
+        """asset 타입 → assets 내 위치 목록"""
+        type_index: defaultdict[str, list[int]] = defaultdict(list)
+        for i, asset in enumerate(self.assets):
+            type_index[asset.get("type", "")].append(i)
+        return dict(type_index)
+
+    def get_assets_by_type(self, asset_type: str) -> list[dict[str, Any]]:
+        """지정 타입 assets만 반환
+
+        타입별 인덱스를 사용하므로 assets 전체를 순회하지 않습니다.
+
+        Args:
+            asset_type: asset 타입 (data, image, video, script)
+
+        Returns:
+            해당 타입 assets 리스트 (빌드 순서 유지, 없으면 빈 리스트)
+        """
+        return [self.assets[i] for i in self._type_index.get(asset_type, ())]
+
+    @cached_property
+    def _assets_by_name(self) -> dict[str, dict[str, Any]]:
+        """layerName → asset (같은 레이어는 마지막 asset)"""
+        return {asset["layerName"]: asset for asset in self.assets if "layerName" in asset}
+
+    def get_asset(self, layer_name: str) -> dict[str, Any] | None:
+        """레이어명으로 asset 조회
+
+        같은 레이어에 asset이 여러 개면 Nexrender가 마지막에 적용하는 asset을 반환합니다.
+
+        Args:
+            layer_name: AEP 레이어명
+
+        Returns:
+            asset 딕셔너리 또는 None
+        """
+        return self._assets_by_name.get(layer_name)
+
+    @cached_property
+    def data_values(self) -> frozenset[str]:
+        """data(텍스트) asset 값 집합
+
+        값 존재 여부 확인/중복 검사를 해시 조회로 처리할 때 사용합니다.
+        """
+        # metadata로 병합된 data asset은 value가 없거나(expression) 리스트일 수 있음
+        return frozenset(
+            value
+            for asset in self.get_assets_by_type("data")
+            if isinstance(value := asset.get("value"), str)
+        )
 
 
 class NexrenderJobBuilder:
@@ -51,6 +140,10 @@ class NexrenderJobBuilder:
         self.mapping_loader = mapping_loader or MappingLoader()
         self._template_name = extract_template_name(config.aep_project_path)
 
+        # 출력 경로 접두사/접미사 (config가 불변이므로 1회 계산)
+        self._output_prefix = f"{config.output_dir}/"
+        self._output_suffix = f".{config.output_ext}"
+
     def build_from_gfx_data(
         self,
         gfx_data: dict[str, Any],
@@ -77,9 +170,10 @@ class NexrenderJobBuilder:
                     "actions": {...}
                 }
         """
+        assets = self._build_assets_from_gfx(gfx_data)
         job_data = {
             "template": self._build_template_section(),
-            "assets": self._build_assets_from_gfx(gfx_data),
+            "assets": assets,
             "actions": self._build_actions_section(job_id),
         }
 
@@ -220,14 +314,16 @@ class NexrenderJobBuilder:
             gfx_field: GFX JSON 필드명 (예: "event_name", "slot1_name")
 
         Returns:
-            AEP 레이어명 (매핑된 이름 또는 원본)
+            AEP 레이어명 (매핑된 이름 또는 원본, intern 처리되어 동일 이름은 같은 객체)
         """
         mapped_name = self.mapping_loader.get_layer_name(
             self._template_name,
             self.config.composition_name,
             gfx_field,
         )
-        return mapped_name or gfx_field
+        layer_name = mapped_name or gfx_field
+        # YAML 매핑 값은 숫자 등 비문자열일 수 있으므로 str만 intern
+        return sys.intern(layer_name) if isinstance(layer_name, str) else layer_name
 
     def _build_assets_from_gfx(self, gfx_data: dict[str, Any]) -> list[dict[str, Any]]:
         """gfx_data에서 assets 배열 생성
@@ -254,34 +350,27 @@ class NexrenderJobBuilder:
             if disable_script:
                 assets.append(disable_script)
 
-        # Slots 처리 (슬롯 기반 반복 데이터)
+        # Slots (slot{N}_{field}) + Single Fields → (GFX 필드명, 값) 목록
+        # 슬롯 접두사는 사전 생성된 문자열을 재사용 (필드마다 포맷하지 않음)
+        gfx_fields = []
         for slot in gfx_data.get("slots", []):
-            slot_index = slot["slot_index"]
-            for field_name, value in slot["fields"].items():
-                gfx_field = f"slot{slot_index}_{field_name}"
-                # 매핑된 레이어명 조회 (없으면 원본 사용)
-                layer_name = self._get_mapped_layer_name(gfx_field)
-                assets.append(
-                    {
-                        "type": "data",
-                        "layerName": layer_name,
-                        "property": "Source Text",
-                        "value": str(value),
-                    }
-                )
-
-        # Single Fields 처리 (단일 필드)
-        for field_name, value in gfx_data.get("single_fields", {}).items():
-            # 매핑된 레이어명 조회 (없으면 원본 사용)
-            layer_name = self._get_mapped_layer_name(field_name)
-            assets.append(
-                {
-                    "type": "data",
-                    "layerName": layer_name,
-                    "property": "Source Text",
-                    "value": str(value),
-                }
+            prefix = slot_field_prefix(slot["slot_index"])
+            gfx_fields.extend(
+                (prefix + field_name, value) for field_name, value in slot["fields"].items()
             )
+        gfx_fields.extend(gfx_data.get("single_fields", {}).items())
+
+        # 텍스트 assets 일괄 생성 (매핑된 레이어명 조회, 없으면 원본 사용)
+        get_layer_name = self._get_mapped_layer_name
+        assets.extend(
+            {
+                "type": "data",
+                "layerName": get_layer_name(gfx_field),
+                "property": "Source Text",
+                "value": str(value),
+            }
+            for gfx_field, value in gfx_fields
+        )
 
         # Metadata에 직접 저장된 assets 병합 (이미지/비디오 등)
         if "assets" in gfx_data.get("metadata", {}):
@@ -299,9 +388,7 @@ class NexrenderJobBuilder:
 
         return assets
 
-    def _get_disable_layers_script(
-        self, layer_patterns: list[str]
-    ) -> dict[str, Any] | None:
+    def _get_disable_layers_script(self, layer_patterns: list[str]) -> dict[str, Any] | None:
         """배경/비활성화할 레이어를 숨기는 JSX 스크립트 생성
 
         렌더링 전에 지정된 패턴과 일치하는 레이어들을 비활성화합니다.
@@ -436,16 +523,15 @@ class NexrenderJobBuilder:
             output_filename = output_filename.rsplit(".", 1)[0]
 
         # 출력 경로 구성
-        output_ext = self._get_output_extension()
         output_path = self.path_converter.to_windows_path(
-            f"{self.config.output_dir}/{output_filename}.{output_ext}"
+            self._output_prefix + output_filename + self._output_suffix
         )
 
         return {
             "postrender": [
                 {
                     "module": "@nexrender/action-copy",
-                    "input": f"result.{output_ext}",
+                    "input": "result" + self._output_suffix,
                     "output": output_path,
                 }
             ]
@@ -457,10 +543,4 @@ class NexrenderJobBuilder:
         Returns:
             파일 확장자 (mp4, mov, png 등)
         """
-        format_map = {
-            "mp4": "mp4",
-            "mov": "mov",
-            "mov_alpha": "mov",
-            "png_sequence": "png",
-        }
-        return format_map.get(self.config.output_format.lower(), "mp4")
+        return self.config.output_ext
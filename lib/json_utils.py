@@ -0,0 +1,21 @@
+"""
+JSON 직렬화 유틸리티
+
+orjson 설치 시 orjson, 없으면 표준 json으로 직렬화합니다.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson  # 선택적 의존성 (빠른 JSON 직렬화)
+except ImportError:
+    orjson = None
+
+# 객체 → JSON bytes (orjson 미설치 시 표준 json, 둘 다 compact UTF-8)
+dumps: Callable[[Any], bytes] = (
+    orjson.dumps
+    if orjson is not None
+    else lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+)
@@ -9,6 +9,7 @@ GFX JSON 필드명과 AEP 레이어명 간의 매핑을 관리합니다.
 - 매핑 설정 파일만 수정하여 동기화
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,34 @@ from typing import Any
 import yaml
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_mapping_file(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """매핑 파일 파싱 (mtime_ns는 캐시 키 용도, 파일 변경 시 재파싱)"""
+    if path.suffix == ".yaml":
+        return _load_yaml(path)
+    return _load_json(path)
+
+
+def _load_yaml(path: Path) -> dict[str, Any]:
+    """YAML 파일 로드"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except Exception as e:
+        print(f"[MappingLoader] YAML 로드 실패: {path} - {e}")
+        return {}
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    """JSON 파일 로드"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[MappingLoader] JSON 로드 실패: {path} - {e}")
+        return {}
+
+
 class MappingLoader:
     """AEP 템플릿별 레이어 매핑 로더
 
@@ -53,7 +82,8 @@ class MappingLoader:
         """매핑 설정 파일 로드
 
         YAML 파일 우선, JSON 파일 폴백.
-        로드된 설정은 메모리에 캐시됩니다.
+        로드된 설정은 인스턴스에 캐시되며, 파싱 결과는 (경로, 수정 시각) 기준으로
+        프로세스 전역에서 공유되어 새 MappingLoader 인스턴스도 재파싱하지 않습니다.
 
         Args:
             template_name: AEP 템플릿 이름 (확장자 제외)
@@ -66,37 +96,19 @@ class MappingLoader:
 
         mapping: dict[str, Any] = {}
 
-        # YAML 우선
-        yaml_path = self.mappings_dir / f"{template_name}.yaml"
-        if yaml_path.exists():
-            mapping = self._load_yaml(yaml_path)
-        else:
-            # JSON 폴백
-            json_path = self.mappings_dir / f"{template_name}.json"
-            if json_path.exists():
-                mapping = self._load_json(json_path)
+        # YAML 우선, JSON 폴백
+        for suffix in (".yaml", ".json"):
+            path = self.mappings_dir / f"{template_name}{suffix}"
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            mapping = _parse_mapping_file(path, mtime_ns)
+            break
 
         self._cache[template_name] = mapping
         return mapping
 
-    def _load_yaml(self, path: Path) -> dict[str, Any]:
-        """YAML 파일 로드"""
-        try:
-            with open(path, encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        except Exception as e:
-            print(f"[MappingLoader] YAML 로드 실패: {path} - {e}")
-            return {}
-
-    def _load_json(self, path: Path) -> dict[str, Any]:
-        """JSON 파일 로드"""
-        try:
-            with open(path, encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"[MappingLoader] JSON 로드 실패: {path} - {e}")
-            return {}
-
     def get_layer_name(
         self,
         template_name: str,
@@ -244,3 +256,21 @@ def extract_template_name(aep_path: str) -> str:
     """
     path = Path(aep_path)
     return path.stem  # 확장자 제외한 파일명
+
+
+# 슬롯 필드 접두사 사전 생성 (slot1_ ~ slot32_, 인덱스 = slot_index - 1)
+_SLOT_PREFIXES = tuple(f"slot{i}_" for i in range(1, 33))
+
+
+def slot_field_prefix(slot_index: int) -> str:
+    """슬롯 번호의 GFX 필드명 접두사 반환
+
+    Args:
+        slot_index: 슬롯 번호 (1부터 시작)
+
+    Returns:
+        필드명 접두사 (예: slot1_, 사전 생성 범위 밖이면 즉석 생성)
+    """
+    if 1 <= slot_index <= len(_SLOT_PREFIXES):
+        return _SLOT_PREFIXES[slot_index - 1]
+    return f"slot{slot_index}_"
@@ -8,10 +8,10 @@ GFX 데이터가 매핑 파일과 일치하는지 확인하고,
 from dataclasses import dataclass, field
 from typing import Any
 
-from .mapping_loader import MappingLoader
+from .mapping_loader import MappingLoader, slot_field_prefix
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """매핑 검증 결과
 
@@ -85,9 +85,7 @@ class MappingValidator:
         mapping = self.mapping_loader.load(template_name)
         if not mapping:
             result.is_valid = False
-            result.errors.append(
-                f"Template '{template_name}' mapping file not found"
-            )
+            result.errors.append(f"Template '{template_name}' mapping file not found")
             return result
 
         # 2. 컴포지션 존재 확인
@@ -106,9 +104,9 @@ class MappingValidator:
             result.warnings.append("GFX data is empty or has no fields")
             return result
 
-        # 4. 매핑 정보 조회
-        comp_mapping = compositions.get(composition_name, {})
-        field_mappings = comp_mapping.get("field_mappings", {})
+        # 4. 매핑 정보 조회 (본문이 비어 있는 컴포지션은 매핑 없음으로 처리)
+        comp_mapping = compositions[composition_name] or {}
+        field_mappings = comp_mapping.get("field_mappings") or {}
 
         # 5. 필드 분류
         for gfx_field in gfx_fields:
@@ -129,9 +127,7 @@ class MappingValidator:
 
         # missing_fields는 경고만 (필수가 아닐 수 있음)
         if result.missing_fields:
-            result.warnings.append(
-                f"Mapping fields not in GFX data: {result.missing_fields}"
-            )
+            result.warnings.append(f"Mapping fields not in GFX data: {result.missing_fields}")
 
         return result
 
@@ -144,22 +140,13 @@ class MappingValidator:
         Returns:
             필드명 집합 (single_fields 키 + slot{N}_{field} 형태)
         """
-        fields: set[str] = set()
-
         # single_fields 추출
-        single_fields = gfx_data.get("single_fields", {})
-        fields.update(single_fields.keys())
+        fields: set[str] = set(gfx_data.get("single_fields", {}))
 
-        # slots 추출 (slot{N}_{field} 형태로 변환)
-        slots = gfx_data.get("slots", [])
-        for slot in slots:
-            slot_index = slot.get("slot_index", 0)
-            slot_fields = slot.get("fields", {})
-
-            for field_name in slot_fields:
-                # slot1_name, slot2_chips 형태로 변환
-                prefixed_field = f"slot{slot_index}_{field_name}"
-                fields.add(prefixed_field)
+        # slots 추출 (slot1_name, slot2_chips 형태로 변환)
+        for slot in gfx_data.get("slots", []):
+            prefix = slot_field_prefix(slot.get("slot_index", 0))
+            fields.update(prefix + field_name for field_name in slot.get("fields", {}))
 
         return fields
 
@@ -178,11 +165,7 @@ class MappingValidator:
             컴포지션 존재 여부
         """
         mapping = self.mapping_loader.load(template_name)
-        if not mapping:
-            return False
-
-        compositions = mapping.get("compositions", {})
-        return composition_name in compositions
+        return composition_name in mapping.get("compositions", {})
 
     def get_composition_info(
         self,
@@ -11,6 +11,9 @@ Docker ↔ Windows 경로 변환 유틸리티
 - 양방향 변환 지원
 """
 
+import functools
+import re
+from collections.abc import Iterable
 from typing import NamedTuple
 
 
@@ -21,21 +24,117 @@ class PathMapping(NamedTuple):
     windows_path: str
 
 
+# 백슬래시 → 슬래시 변환 테이블
+_BACKSLASH_TO_SLASH = str.maketrans("\\", "/")
+
+
+def _compile_prefix_re(prefixes: Iterable[str]) -> re.Pattern[str]:
+    """접두사 목록을 단일 alternation 정규식으로 컴파일
+
+    re.match로 사용하므로 문자열 시작에 고정되며,
+    alternation은 선언 순서대로 시도되어 기존 순차 비교와 우선순위가 같습니다.
+    """
+    return re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+
+
+class _MappingTables(NamedTuple):
+    """매핑 규칙에서 만든 접두사 정규식과 치환 테이블"""
+
+    docker_prefix_re: re.Pattern[str]
+    docker_to_windows: dict[str, str]
+    windows_prefix_re: re.Pattern[str]
+    windows_to_docker: dict[str, str]
+
+
+@functools.lru_cache(maxsize=64)
+def _mapping_tables(mappings: tuple[PathMapping, ...]) -> _MappingTables:
+    """매핑 접두사 사전 컴파일 (접두사 → 치환 경로, 먼저 선언된 매핑 우선)
+
+    같은 매핑으로 생성된 PathConverter 인스턴스끼리 공유됩니다.
+    """
+    docker_to_windows: dict[str, str] = {}
+    windows_to_docker: dict[str, str] = {}
+    for mapping in mappings:
+        docker_to_windows.setdefault(mapping.docker_path, mapping.windows_path)
+        windows_to_docker.setdefault(mapping.windows_path, mapping.docker_path)
+
+    return _MappingTables(
+        _compile_prefix_re(m.docker_path for m in mappings),
+        docker_to_windows,
+        _compile_prefix_re(m.windows_path for m in mappings),
+        windows_to_docker,
+    )
+
+
+# 변환 결과 캐시는 (매핑, 경로) 키로 모듈 단위 공유
+# Job마다 PathConverter를 새로 만들어도 캐시가 유지됨
+@functools.lru_cache(maxsize=4096)
+def _to_windows_path(mappings: tuple[PathMapping, ...], docker_path: str) -> str:
+    """Docker 경로 → Windows 경로 (캐시 적용)"""
+    tables = _mapping_tables(mappings)
+    match = tables.docker_prefix_re.match(docker_path)
+    if match is None:
+        return docker_path
+    return tables.docker_to_windows[match.group()] + docker_path[match.end() :]
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_docker_path(mappings: tuple[PathMapping, ...], windows_path: str) -> str:
+    """Windows 경로 → Docker 경로 (캐시 적용)"""
+    # 백슬래시를 슬래시로 정규화
+    normalized = windows_path.translate(_BACKSLASH_TO_SLASH)
+
+    tables = _mapping_tables(mappings)
+    match = tables.windows_prefix_re.match(normalized)
+    if match is None:
+        return windows_path
+    return tables.windows_to_docker[match.group()] + normalized[match.end() :]
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_file_url(mappings: tuple[PathMapping, ...], path: str) -> str:
+    """경로 → file:// URL (캐시 적용)"""
+    # 이미 file:// URL인 경우 그대로 반환
+    if path.startswith("file://"):
+        return path
+
+    # Docker 경로를 Windows 경로로 변환
+    windows_path = _to_windows_path(mappings, path)
+
+    # 백슬래시를 슬래시로 변환
+    windows_path = windows_path.translate(_BACKSLASH_TO_SLASH)
+
+    # Windows 드라이브 경로인 경우 (C:/)
+    if len(windows_path) >= 2 and windows_path[1] == ":":
+        return f"file:///{windows_path}"
+
+    # UNC 경로인 경우 (//NAS/)
+    if windows_path.startswith("//"):
+        return f"file:{windows_path}"
+
+    # 이미 슬래시로 시작하는 경우
+    if windows_path.startswith("/"):
+        return f"file://{windows_path}"
+
+    return f"file:///{windows_path}"
+
+
 class PathConverter:
     """Docker ↔ Windows 경로 변환기"""
 
-    DEFAULT_MAPPINGS = [
+    DEFAULT_MAPPINGS = (
         PathMapping("/app/templates", "C:/claude/automation_ae/templates"),
         PathMapping("/app/output", "C:/claude/automation_ae/output"),
         PathMapping("/nas/renders", "//NAS/renders"),
-    ]
+    )
 
     def __init__(self, mappings: list[PathMapping] | None = None):
         """
         Args:
             mappings: 경로 매핑 규칙 리스트. None이면 DEFAULT_MAPPINGS 사용.
         """
-        self.mappings = mappings or self.DEFAULT_MAPPINGS
+        # 변환 캐시 키로 쓰이므로 생성 시점 매핑을 해시 가능한 튜플로 고정
+        self.mappings: tuple[PathMapping, ...] = tuple(mappings or self.DEFAULT_MAPPINGS)
 
     def to_windows_path(self, docker_path: str) -> str:
         """Docker 경로 → Windows 경로
@@ -51,10 +150,7 @@ class PathConverter:
             >>> converter.to_windows_path("/app/templates/file.aep")
             'C:/claude/automation_ae/templates/file.aep'
         """
-        for mapping in self.mappings:
-            if docker_path.startswith(mapping.docker_path):
-                return docker_path.replace(mapping.docker_path, mapping.windows_path, 1)
-        return docker_path
+        return _to_windows_path(self.mappings, docker_path)
 
     def to_docker_path(self, windows_path: str) -> str:
         """Windows 경로 → Docker 경로
@@ -70,13 +166,7 @@ class PathConverter:
             >>> converter.to_docker_path("C:/claude/automation_ae/templates/file.aep")
             '/app/templates/file.aep'
         """
-        # 백슬래시를 슬래시로 정규화
-        normalized = windows_path.replace("\\", "/")
-
-        for mapping in self.mappings:
-            if normalized.startswith(mapping.windows_path):
-                return normalized.replace(mapping.windows_path, mapping.docker_path, 1)
-        return windows_path
+        return _to_docker_path(self.mappings, windows_path)
 
     def to_file_url(self, path: str) -> str:
         """경로를 file:// URL로 변환 (Nexrender용)
@@ -98,26 +188,4 @@ class PathConverter:
             >>> converter.to_file_url("//NAS/renders/output.mp4")
             'file://NAS/renders/output.mp4'
         """
-        # 이미 file:// URL인 경우 그대로 반환
-        if path.startswith("file://"):
-            return path
-
-        # Docker 경로를 Windows 경로로 변환
-        windows_path = self.to_windows_path(path)
-
-        # 백슬래시를 슬래시로 변환
-        windows_path = windows_path.replace("\\", "/")
-
-        # Windows 드라이브 경로인 경우 (C:/)
-        if len(windows_path) >= 2 and windows_path[1] == ":":
-            return f"file:///{windows_path}"
-
-        # UNC 경로인 경우 (//NAS/)
-        if windows_path.startswith("//"):
-            return f"file:{windows_path}"
-
-        # 이미 슬래시로 시작하는 경우
-        if windows_path.startswith("/"):
-            return f"file://{windows_path}"
-
-        return f"file:///{windows_path}"
+        return _to_file_url(self.mappings, path)
@@ -0,0 +1,30 @@
+-- ============================================================================
+-- 004_claim_pending_render_job.sql
+-- claim_pending_render_job: 기존 스키마용 Atomic 작업 할당 함수
+--
+-- 워커(SupabaseQueueClient.claim_pending_job)가 SELECT → UPDATE 2회 왕복 대신
+-- 1회 RPC로 작업을 할당합니다. FOR UPDATE SKIP LOCKED로 동시에 폴링하는
+-- 워커들은 서로 다른 행을 가져갑니다.
+-- (003의 claim_render_job은 UUID worker_id/lock_expires_at 기반 v2 스키마용)
+-- ============================================================================
+CREATE OR REPLACE FUNCTION claim_pending_render_job(
+    p_worker_id TEXT,
+    p_worker_host TEXT
+)
+RETURNS SETOF render_queue
+LANGUAGE sql
+AS $$
+    UPDATE render_queue
+    SET status = 'preparing',
+        worker_id = p_worker_id,
+        worker_host = p_worker_host,
+        started_at = NOW()
+    WHERE id = (
+        SELECT id FROM render_queue
+        WHERE status = 'pending'
+        ORDER BY priority ASC, queued_at ASC  -- 낮은 숫자 = 높은 우선순위, 오래된 것 먼저
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING *;
+$$;
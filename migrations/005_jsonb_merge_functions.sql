@@ -0,0 +1,93 @@
+-- ============================================================================
+-- 005_jsonb_merge_functions.sql
+-- metadata / error_details JSONB 원자적 병합 함수 (기존 스키마용)
+--
+-- 워커(SupabaseQueueClient)가 get_job → dict 병합 → update 대신
+-- 1회 RPC로 JSONB 컬럼을 갱신합니다. (조회 왕복 제거, 동시 갱신 유실 방지)
+-- ============================================================================
+
+-- metadata 병합: metadata || p_patch
+CREATE OR REPLACE FUNCTION merge_render_job_metadata(
+    p_job_id UUID,
+    p_patch JSONB
+)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE render_queue
+    SET metadata = COALESCE(metadata, '{}'::jsonb) || p_patch
+    WHERE id = p_job_id;
+$$;
+
+-- 작업 실패 처리: retry_count 증가 후 재시도 가능하면 pending, 아니면 failed
+CREATE OR REPLACE FUNCTION fail_render_job(
+    p_job_id UUID,
+    p_error_message TEXT,
+    p_error_category TEXT,
+    p_should_retry BOOLEAN
+)
+RETURNS SETOF render_queue
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_details JSONB;
+    v_retry_count INTEGER;
+    v_max_retries INTEGER;
+BEGIN
+    SELECT COALESCE(error_details, '{}'::jsonb) INTO v_details
+    FROM render_queue
+    WHERE id = p_job_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    v_retry_count := COALESCE((v_details->>'retry_count')::INTEGER, 0) + 1;
+    v_max_retries := COALESCE((v_details->>'max_retries')::INTEGER, 3);
+    v_details := v_details || jsonb_build_object(
+        'retry_count', v_retry_count,
+        'max_retries', v_max_retries,
+        'error_category', p_error_category,
+        'last_error_at', NOW()
+    );
+
+    IF p_should_retry AND v_retry_count < v_max_retries THEN
+        RETURN QUERY
+        UPDATE render_queue
+        SET status = 'pending',
+            error_message = p_error_message,
+            error_details = v_details,
+            worker_id = NULL
+        WHERE id = p_job_id
+        RETURNING *;
+    ELSE
+        RETURN QUERY
+        UPDATE render_queue
+        SET status = 'failed',
+            error_message = p_error_message,
+            error_details = v_details,
+            completed_at = NOW(),
+            worker_id = NULL
+        WHERE id = p_job_id
+        RETURNING *;
+    END IF;
+END;
+$$;
+
+-- 작업 락 해제: recovery_count 증가 후 pending으로 복원
+CREATE OR REPLACE FUNCTION release_render_job(
+    p_job_id UUID
+)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE render_queue
+    SET status = 'pending',
+        worker_id = NULL,
+        error_details = COALESCE(error_details, '{}'::jsonb) || jsonb_build_object(
+            'recovery_count', COALESCE((error_details->>'recovery_count')::INTEGER, 0) + 1,
+            'last_recovery_at', NOW()
+        )
+    WHERE id = p_job_id;
+$$;
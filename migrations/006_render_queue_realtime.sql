@@ -0,0 +1,19 @@
+-- ============================================================================
+-- 006_render_queue_realtime.sql
+-- render_queue 변경을 Supabase Realtime(postgres_changes)으로 게시
+--
+-- REALTIME_ENABLED=true인 워커는 pending 작업 INSERT 알림을 받으면 즉시
+-- claim_pending_render_job을 호출하고, 폴링은 안전망(60초)으로만 사용합니다.
+-- ============================================================================
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_publication_tables
+        WHERE pubname = 'supabase_realtime'
+          AND schemaname = 'public'
+          AND tablename = 'render_queue'
+    ) THEN
+        ALTER PUBLICATION supabase_realtime ADD TABLE public.render_queue;
+    END IF;
+END;
+$$;
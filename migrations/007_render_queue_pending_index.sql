@@ -0,0 +1,14 @@
+-- ============================================================================
+-- 007_render_queue_pending_index.sql
+-- pending 작업 할당용 부분 인덱스 (기존 스키마용)
+--
+-- claim_pending_render_job (migrations/004)의
+--   WHERE status = 'pending' ORDER BY priority ASC, queued_at ASC LIMIT 1
+-- 조건을 인덱스 선두 1행 조회로 처리합니다. 완료/실패 이력이 쌓여도
+-- 인덱스 크기는 pending 작업 수에만 비례합니다.
+--
+-- CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 단독 실행하세요.
+-- ============================================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_render_queue_pending
+    ON public.render_queue (priority ASC, queued_at ASC)
+    WHERE status = 'pending';
@@ -2,6 +2,7 @@
 Pytest 설정 및 공통 Fixture
 """
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -10,6 +11,39 @@ from lib.path_utils import PathConverter, PathMapping
 from worker.config import WorkerConfig
 
 
+@pytest.fixture(autouse=True)
+async def _cancel_leaked_tasks():
+    """세션 공유 이벤트 루프에서 테스트 간 태스크 누수 방지
+
+    테스트 종료 후 남아있는 태스크를 취소합니다.
+    """
+    yield
+    current = asyncio.current_task()
+    leaked = [t for t in asyncio.all_tasks() if t is not current and not t.done()]
+    for task in leaked:
+        task.cancel()
+    if leaked:
+        await asyncio.gather(*leaked, return_exceptions=True)
+
+
+_real_asyncio_sleep = asyncio.sleep
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """asyncio.sleep / time.sleep을 즉시 반환하도록 대체
+
+    폴링/재시도 대기 시간이 테스트 시간을 지배하지 않도록 합니다.
+    asyncio.sleep은 다른 태스크가 진행될 수 있도록 제어권만 양보합니다.
+    """
+
+    async def _instant_sleep(delay, result=None):
+        return await _real_asyncio_sleep(0, result)
+
+    monkeypatch.setattr("asyncio.sleep", _instant_sleep)
+    monkeypatch.setattr("time.sleep", lambda _: None)
+
+
 @pytest.fixture
 def sample_gfx_data() -> dict[str, Any]:
     """샘플 GFX 데이터 (기본)"""
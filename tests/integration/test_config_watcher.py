@@ -0,0 +1,23 @@
+"""
+ConfigWatcher 핫 리로드 통합 테스트
+
+실제 파일 시스템 이벤트가 필요하므로 기본 실행에서 제외됩니다.
+실행: pytest -m integration
+"""
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+
+class TestConfigWatcher:
+    """ConfigWatcher 핫 리로드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_watcher_detects_change(self):
+        """파일 변경 감지 테스트 (watchdog 설치 시)"""
+        pytest.importorskip("watchdog")
+
+        # 이 테스트는 실제 파일 시스템 이벤트가 필요하므로
+        # 통합 테스트에서 수행하는 것이 좋음
+        pass
@@ -5,6 +5,7 @@ JobProcessor E2E 통합 테스트
 Mock을 사용하여 외부 의존성을 대체합니다.
 """
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
@@ -97,9 +98,7 @@ def sample_render_job(test_config: WorkerConfig) -> dict[str, Any]:
         "output_format": "mp4",
         "output_path": f"{test_config.output_dir}/test-job-12345.mp4",
         "gfx_data": {
-            "slots": [
-                {"slot_index": 1, "fields": {"name": "Player 1", "chips": "100,000"}}
-            ],
+            "slots": [{"slot_index": 1, "fields": {"name": "Player 1", "chips": "100,000"}}],
             "single_fields": {"table_id": "Table 1", "event_name": "Test Event"},
         },
         "render_type": "custom",
@@ -124,9 +123,7 @@ class TestJobProcessorE2E:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(b"fake video content" * 1000)  # 18KB
 
-        with patch(
-            "worker.job_processor.NexrenderClient", return_value=mock_nexrender_client
-        ):
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender_client):
             processor = JobProcessor(test_config, mock_supabase_client)
             result = await processor.process(sample_render_job)
 
@@ -185,9 +182,7 @@ class TestJobProcessorE2E:
         """파일 검증 - 파일 없음 테스트"""
         # 출력 파일을 생성하지 않음 (렌더링 실패 시뮬레이션)
 
-        with patch(
-            "worker.job_processor.NexrenderClient", return_value=mock_nexrender_client
-        ):
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender_client):
             processor = JobProcessor(test_config, mock_supabase_client)
 
             with pytest.raises(FileNotFoundError) as exc_info:
@@ -195,6 +190,18 @@ class TestJobProcessorE2E:
 
             assert "출력 파일 없음" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_file_validation_unreachable_path(
+        self, test_config: WorkerConfig, mock_supabase_client, tmp_path: Path
+    ):
+        """파일 검증 - 상위 경로가 파일이면 파일 없음으로 처리"""
+        not_a_dir = tmp_path / "not_a_dir"
+        not_a_dir.write_bytes(b"")
+        processor = JobProcessor(test_config, mock_supabase_client)
+
+        with pytest.raises(FileNotFoundError, match="출력 파일 없음"):
+            await processor._verify_output_file(not_a_dir / "out.mp4", "job-1")
+
     @pytest.mark.asyncio
     async def test_file_validation_empty_file(
         self,
@@ -209,9 +216,7 @@ class TestJobProcessorE2E:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(b"")  # 0 bytes
 
-        with patch(
-            "worker.job_processor.NexrenderClient", return_value=mock_nexrender_client
-        ):
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender_client):
             processor = JobProcessor(test_config, mock_supabase_client)
 
             with pytest.raises(ValueError) as exc_info:
@@ -257,9 +262,7 @@ class TestJobProcessorE2E:
         output_file = Path(job["output_path"])
         output_file.write_bytes(b"video content" * 1000)
 
-        with patch(
-            "worker.job_processor.NexrenderClient", return_value=mock_nexrender_client
-        ):
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender_client):
             processor = JobProcessor(config, mock_supabase_client)
             result = await processor.process(job)
 
@@ -304,9 +307,7 @@ class TestJobProcessorE2E:
         output_file = Path(job["output_path"])
         output_file.write_bytes(b"video content" * 1000)
 
-        with patch(
-            "worker.job_processor.NexrenderClient", return_value=mock_nexrender_client
-        ):
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender_client):
             processor = JobProcessor(config, mock_supabase_client)
             result = await processor.process(job)
 
@@ -329,9 +330,7 @@ class TestJobProcessorRetry:
         """재시도 가능 에러 시 retry_count 증가 테스트"""
         # 네트워크 오류 시뮬레이션
         mock_nexrender = AsyncMock()
-        mock_nexrender.submit_job = AsyncMock(
-            side_effect=ConnectionError("Network error")
-        )
+        mock_nexrender.submit_job = AsyncMock(side_effect=ConnectionError("Network error"))
 
         with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender):
             processor = JobProcessor(test_config, mock_supabase_client)
@@ -353,9 +352,7 @@ class TestJobProcessorRetry:
         """재시도 불가 에러 시 즉시 실패 테스트"""
         # 잘못된 설정 오류 시뮬레이션 (재시도 불가)
         mock_nexrender = AsyncMock()
-        mock_nexrender.submit_job = AsyncMock(
-            side_effect=ValueError("Invalid configuration")
-        )
+        mock_nexrender.submit_job = AsyncMock(side_effect=ValueError("Invalid configuration"))
 
         with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender):
             processor = JobProcessor(test_config, mock_supabase_client)
@@ -385,9 +382,7 @@ class TestJobProcessorStatusTransitions:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(b"video" * 1000)
 
-        with patch(
-            "worker.job_processor.NexrenderClient", return_value=mock_nexrender_client
-        ):
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender_client):
             processor = JobProcessor(test_config, mock_supabase_client)
             await processor.process(sample_render_job)
 
@@ -400,8 +395,195 @@ class TestJobProcessorStatusTransitions:
         assert RenderStatus.PREPARING.value in status_calls
         assert RenderStatus.RENDERING.value in status_calls
 
+        # 폴링 중 상태는 진행률과 함께 단일 UPDATE로 반영
+        progress_statuses = [
+            call.kwargs.get("status")
+            for call in mock_supabase_client.update_progress.call_args_list
+        ]
+        assert RenderStatus.UPLOADING.value in progress_statuses
+
         output_path.unlink()
 
+    @pytest.mark.asyncio
+    async def test_unchanged_progress_skips_update(
+        self,
+        test_config: WorkerConfig,
+        mock_supabase_client,
+    ):
+        """Nexrender 상태/진행률 변화가 없으면 Supabase 업데이트 생략"""
+        mock_nexrender = AsyncMock()
+        mock_nexrender.get_job = AsyncMock(
+            side_effect=[
+                {"state": "rendering", "renderProgress": 50},
+                {"state": "rendering", "renderProgress": 50},
+                {"state": "rendering", "renderProgress": 50},
+                {"state": "finished", "renderProgress": 1.0},
+            ]
+        )
+
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender):
+            processor = JobProcessor(test_config, mock_supabase_client)
+            await processor._poll_nexrender_progress("test-job", "nexrender-uid")
+
+        progress_calls = [
+            call.kwargs["progress"] for call in mock_supabase_client.update_progress.call_args_list
+        ]
+        assert progress_calls == [60, 95]
+
+    @pytest.mark.asyncio
+    async def test_small_progress_change_skips_update(
+        self,
+        test_config: WorkerConfig,
+        mock_supabase_client,
+    ):
+        """같은 state에서 진행률 변화가 최소 폭 미만이면 업데이트 생략"""
+        mock_nexrender = AsyncMock()
+        mock_nexrender.get_job = AsyncMock(
+            side_effect=[
+                {"state": "rendering", "renderProgress": 50},  # 60
+                {"state": "rendering", "renderProgress": 53},  # 61 (생략)
+                {"state": "rendering", "renderProgress": 55},  # 62
+                {"state": "finished", "renderProgress": 100},
+            ]
+        )
+
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender):
+            processor = JobProcessor(test_config, mock_supabase_client)
+            await processor._poll_nexrender_progress("test-job", "nexrender-uid")
+
+        progress_calls = [
+            call.kwargs["progress"] for call in mock_supabase_client.update_progress.call_args_list
+        ]
+        assert progress_calls == [60, 62, 95]
+
+    @pytest.mark.asyncio
+    async def test_nexrender_state_sent_only_on_change(
+        self,
+        test_config: WorkerConfig,
+        mock_supabase_client,
+    ):
+        """진행률만 바뀌면 nexrender_state(metadata 갱신) 생략"""
+        mock_nexrender = AsyncMock()
+        mock_nexrender.get_job = AsyncMock(
+            side_effect=[
+                {"state": "rendering", "renderProgress": 20},
+                {"state": "rendering", "renderProgress": 50},
+                {"state": "finished", "renderProgress": 100},
+            ]
+        )
+
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender):
+            processor = JobProcessor(test_config, mock_supabase_client)
+            await processor._poll_nexrender_progress("test-job", "nexrender-uid")
+
+        states = [
+            call.kwargs["nexrender_state"]
+            for call in mock_supabase_client.update_progress.call_args_list
+        ]
+        assert states == ["rendering", None, "finished"]
+
+    @pytest.mark.asyncio
+    async def test_poll_interval_follows_state(
+        self,
+        test_config: WorkerConfig,
+        mock_supabase_client,
+    ):
+        """렌더링 중에는 긴 간격으로 폴링하고 render_timeout 초과 시 타임아웃"""
+        mock_nexrender = AsyncMock()
+        mock_nexrender.get_job = AsyncMock(
+            return_value={"state": "rendering", "renderProgress": 10}
+        )
+
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender):
+            processor = JobProcessor(test_config, mock_supabase_client)
+            with pytest.raises(TimeoutError):
+                await processor._poll_nexrender_progress("test-job", "nexrender-uid")
+
+        # render_timeout=60초, rendering 폴링 간격 10초
+        assert mock_nexrender.get_job.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_poll_interval_shortens_near_completion(
+        self,
+        test_config: WorkerConfig,
+        mock_supabase_client,
+    ):
+        """렌더링 완료 임박 시 encoding 간격으로 폴링"""
+        mock_nexrender = AsyncMock()
+        mock_nexrender.get_job = AsyncMock(
+            return_value={"state": "rendering", "renderProgress": 95}
+        )
+
+        with patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender):
+            processor = JobProcessor(test_config, mock_supabase_client)
+            with pytest.raises(TimeoutError):
+                await processor._poll_nexrender_progress("test-job", "nexrender-uid")
+
+        # render_timeout=60초, 완료 임박 폴링 간격 2초
+        assert mock_nexrender.get_job.await_count == 30
+
+    @pytest.mark.asyncio
+    async def test_get_job_failures_back_off(
+        self,
+        test_config: WorkerConfig,
+        mock_supabase_client,
+    ):
+        """상태 조회 연속 실패 시 지수 백오프로 폴링 간격 증가"""
+        mock_nexrender = AsyncMock()
+        mock_nexrender.get_job = AsyncMock(side_effect=ConnectionError("overloaded"))
+
+        with (
+            patch("worker.job_processor.NexrenderClient", return_value=mock_nexrender),
+            patch("worker.job_processor.random.random", return_value=0.5),
+        ):
+            processor = JobProcessor(test_config, mock_supabase_client)
+            with pytest.raises(TimeoutError):
+                await processor._poll_nexrender_progress("test-job", "nexrender-uid")
+
+        # render_timeout=60초, 기본 간격 5초 → 10, 20, 40초 대기
+        assert mock_nexrender.get_job.await_count == 3
+
+
+class TestNasDirectoryCheck:
+    """NAS 디렉토리 확인 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_nas_dir_check_cached_until_ttl(
+        self, test_config: WorkerConfig, mock_supabase_client, tmp_path: Path
+    ):
+        """TTL 내에는 NAS 디렉토리 stat을 반복하지 않음"""
+        processor = JobProcessor(test_config, mock_supabase_client)
+
+        with patch("worker.job_processor.os.path.isdir", return_value=True) as isdir:
+            assert await processor._is_nas_dir_available(str(tmp_path)) is True
+            assert await processor._is_nas_dir_available(str(tmp_path)) is True
+            assert isdir.call_count == 1
+
+            # TTL 경과 시 재확인
+            checked_at, available = processor._nas_dir_check
+            processor._nas_dir_check = (checked_at - processor._NAS_CHECK_TTL, available)
+            await processor._is_nas_dir_available(str(tmp_path))
+            assert isdir.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_copy_to_nas_stats_off_event_loop(
+        self, test_config: WorkerConfig, mock_supabase_client, tmp_path: Path
+    ):
+        """복사 후 검증 stat도 복사와 같은 스레드 작업에서 실행"""
+        source = tmp_path / "job-1.mp4"
+        source.write_bytes(b"x" * 2048)
+        nas_dir = tmp_path / "nas"
+        nas_dir.mkdir()
+        test_config.nas_output_path = str(nas_dir)
+        processor = JobProcessor(test_config, mock_supabase_client)
+
+        with patch("worker.job_processor.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            nas_path = await processor._copy_to_nas(str(source), "job-1")
+
+        assert nas_path == str(nas_dir / "job-1.mp4")
+        assert (nas_dir / "job-1.mp4").stat().st_size == 2048
+        to_thread.assert_any_await(processor._copy_file, str(source), nas_path)
+
 
 class TestConfigValidation:
     """설정 검증 테스트"""
@@ -91,6 +91,14 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         assert response.json()["status"] == "ok"
 
+    @pytest.mark.asyncio
+    async def test_readiness_bypasses_count_cache(self, app_client, mock_supabase_client):
+        """Readiness 체크는 캐시 없이 DB 조회"""
+        response = await app_client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        mock_supabase_client.get_pending_count.assert_awaited_once_with(max_age=0)
+
 
 class TestRenderEndpoints:
     """렌더링 API 엔드포인트 테스트"""
@@ -186,9 +194,7 @@ class TestRenderEndpoints:
         response = await app_client.delete("/api/v1/render/test-job-id")
 
         assert response.status_code == 204
-        mock_supabase_client.update_job_status.assert_called_once_with(
-            "test-job-id", "cancelled"
-        )
+        mock_supabase_client.update_job_status.assert_called_once_with("test-job-id", "cancelled")
 
     @pytest.mark.asyncio
     async def test_cancel_completed_render(self, app_client, mock_supabase_client):
@@ -234,9 +240,7 @@ class TestRenderEndpoints:
     @pytest.mark.asyncio
     async def test_list_renders_with_filter(self, app_client, mock_supabase_client):
         """필터링 조회"""
-        response = await app_client.get(
-            "/api/v1/render?status=pending&page=1&page_size=10"
-        )
+        response = await app_client.get("/api/v1/render?status=pending&page=1&page_size=10")
 
         assert response.status_code == 200
         mock_supabase_client.list_jobs.assert_called_once()
@@ -4,6 +4,8 @@ Nexrender 클라이언트 테스트
 httpx mock을 사용하여 실제 서버 없이 클라이언트 동작을 검증합니다.
 """
 
+import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -12,6 +14,36 @@ import pytest
 from lib.client import NexrenderClient, NexrenderSyncClient
 from lib.errors import NexrenderError
 
+# 테스트 간 재사용하는 응답 객체 (모듈 로드 시 1회 생성)
+_QUEUED_JOB = {"uid": "job-123", "state": "queued"}
+_FINISHED_JOB = {"uid": "job-123", "state": "finished", "renderProgress": 1.0}
+
+_OK_QUEUED = SimpleNamespace(
+    status_code=200, json=lambda: _QUEUED_JOB, raise_for_status=lambda: None
+)
+_OK_FINISHED = SimpleNamespace(
+    status_code=200, json=lambda: _FINISHED_JOB, raise_for_status=lambda: None
+)
+_404 = SimpleNamespace(status_code=404, text="Not Found")
+_400 = SimpleNamespace(status_code=400, text="Bad Request")
+
+
+def _wire(client: NexrenderClient | NexrenderSyncClient, http_client) -> None:
+    """client._create_client()가 http_client를 반환하도록 직접 연결
+
+    patch.object 컨텍스트 매니저 대신 인스턴스 속성을 바로 교체합니다.
+    client fixture는 테스트마다 새로 생성되므로 복원이 필요 없습니다.
+    """
+    client._create_client = lambda: http_client
+
+
+@pytest.fixture
+def async_cm_client() -> AsyncMock:
+    """async with 문에서 자기 자신을 반환하는 HTTP 클라이언트 Mock"""
+    mock_http_client = AsyncMock()
+    mock_http_client.__aenter__.return_value = mock_http_client
+    return mock_http_client
+
 
 class TestNexrenderClientInit:
     """NexrenderClient 초기화 테스트"""
@@ -75,162 +107,149 @@ class TestNexrenderClientAsync:
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_health_check_success(self, client: NexrenderClient):
+    async def test_session_reused_until_close(self, client: NexrenderClient):
+        """open_session 후에는 요청마다 같은 클라이언트 재사용"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        session = AsyncMock()
+        session.get = AsyncMock(return_value=mock_response)
+        create_client = MagicMock(return_value=session)
+        client._create_client = create_client
+
+        client.open_session()
+        assert await client.health_check() is True
+        assert await client.health_check() is True
+
+        create_client.assert_called_once()
+        assert session.get.await_count == 2
+        session.__aexit__.assert_not_called()
+
+        await client.close()
+        session.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_health_check_success(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """헬스 체크 성공"""
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.get = AsyncMock(return_value=mock_response)
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.get = AsyncMock(return_value=mock_response)
+        _wire(client, mock_http_client)
 
-            result = await client.health_check()
+        result = await client.health_check()
 
-            assert result is True
-            mock_http_client.get.assert_called_once_with("/api/v1/jobs")
+        assert result is True
+        mock_http_client.get.assert_called_once_with("/api/v1/jobs")
 
     @pytest.mark.asyncio
-    async def test_health_check_failure(self, client: NexrenderClient):
+    async def test_health_check_failure(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """헬스 체크 실패 (서버 오류)"""
         mock_response = MagicMock()
         mock_response.status_code = 500
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.get = AsyncMock(return_value=mock_response)
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.get = AsyncMock(return_value=mock_response)
+        _wire(client, mock_http_client)
 
-            result = await client.health_check()
+        result = await client.health_check()
 
-            assert result is False
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_health_check_connection_error(self, client: NexrenderClient):
+    async def test_health_check_connection_error(
+        self, client: NexrenderClient, async_cm_client: AsyncMock
+    ):
         """헬스 체크 연결 오류"""
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+        _wire(client, mock_http_client)
 
-            result = await client.health_check()
+        result = await client.health_check()
 
-            assert result is False
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_submit_job_success(self, client: NexrenderClient):
+    async def test_submit_job_success(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 제출 성공"""
         job_data = {"template": {"src": "file://test.aep"}}
-        response_data = {"uid": "job-123", "state": "queued"}
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = response_data
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.post = AsyncMock(return_value=mock_response)
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.post = AsyncMock(return_value=_OK_QUEUED)
+        _wire(client, mock_http_client)
 
-            result = await client.submit_job(job_data)
+        result = await client.submit_job(job_data)
 
-            assert result == response_data
-            mock_http_client.post.assert_called_once_with("/api/v1/jobs", json=job_data)
+        assert result == _QUEUED_JOB
+        mock_http_client.post.assert_called_once()
+        call = mock_http_client.post.call_args
+        assert call.args == ("/api/v1/jobs",)
+        assert json.loads(call.kwargs["content"]) == job_data
+        assert call.kwargs["headers"]["Content-Type"] == "application/json"
 
     @pytest.mark.asyncio
-    async def test_submit_job_http_error(self, client: NexrenderClient):
+    async def test_submit_job_http_error(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 제출 HTTP 오류"""
         job_data = {"template": {"src": "file://test.aep"}}
 
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.post = AsyncMock(
-                side_effect=httpx.HTTPStatusError(
-                    "Bad Request",
-                    request=MagicMock(),
-                    response=mock_response,
-                )
+        mock_http_client = async_cm_client
+        mock_http_client.post = AsyncMock(
+            side_effect=httpx.HTTPStatusError(
+                "Bad Request",
+                request=MagicMock(),
+                response=_400,
             )
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        )
+        _wire(client, mock_http_client)
 
-            with pytest.raises(NexrenderError, match="작업 제출 실패"):
-                await client.submit_job(job_data)
+        with pytest.raises(NexrenderError, match="작업 제출 실패"):
+            await client.submit_job(job_data)
 
     @pytest.mark.asyncio
-    async def test_submit_job_connection_error(self, client: NexrenderClient):
+    async def test_submit_job_connection_error(
+        self, client: NexrenderClient, async_cm_client: AsyncMock
+    ):
         """작업 제출 연결 오류"""
         job_data = {"template": {"src": "file://test.aep"}}
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+        _wire(client, mock_http_client)
 
-            with pytest.raises(NexrenderError, match="Nexrender 서버 연결 실패"):
-                await client.submit_job(job_data)
+        with pytest.raises(NexrenderError, match="Nexrender 서버 연결 실패"):
+            await client.submit_job(job_data)
 
     @pytest.mark.asyncio
-    async def test_get_job_success(self, client: NexrenderClient):
+    async def test_get_job_success(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 조회 성공"""
-        response_data = {"uid": "job-123", "state": "finished", "renderProgress": 1.0}
+        mock_http_client = async_cm_client
+        mock_http_client.get = AsyncMock(return_value=_OK_FINISHED)
+        _wire(client, mock_http_client)
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = response_data
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.get = AsyncMock(return_value=mock_response)
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        result = await client.get_job("job-123")
 
-            result = await client.get_job("job-123")
-
-            assert result == response_data
-            mock_http_client.get.assert_called_once_with("/api/v1/jobs/job-123")
+        assert result == _FINISHED_JOB
+        mock_http_client.get.assert_called_once_with("/api/v1/jobs/job-123")
 
     @pytest.mark.asyncio
-    async def test_get_job_not_found(self, client: NexrenderClient):
+    async def test_get_job_not_found(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 조회 - 404"""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.get = AsyncMock(
-                side_effect=httpx.HTTPStatusError(
-                    "Not Found",
-                    request=MagicMock(),
-                    response=mock_response,
-                )
+        mock_http_client = async_cm_client
+        mock_http_client.get = AsyncMock(
+            side_effect=httpx.HTTPStatusError(
+                "Not Found",
+                request=MagicMock(),
+                response=_404,
             )
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        )
+        _wire(client, mock_http_client)
 
-            with pytest.raises(NexrenderError, match="작업을 찾을 수 없습니다"):
-                await client.get_job("nonexistent-job")
+        with pytest.raises(NexrenderError, match="작업을 찾을 수 없습니다"):
+            await client.get_job("nonexistent-job")
 
     @pytest.mark.asyncio
-    async def test_list_jobs_success(self, client: NexrenderClient):
+    async def test_list_jobs_success(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 목록 조회 성공"""
         response_data = [
             {"uid": "job-1", "state": "finished"},
@@ -241,78 +260,63 @@ class TestNexrenderClientAsync:
         mock_response.json.return_value = response_data
         mock_response.raise_for_status = MagicMock()
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.get = AsyncMock(return_value=mock_response)
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.get = AsyncMock(return_value=mock_response)
+        _wire(client, mock_http_client)
 
-            result = await client.list_jobs()
+        result = await client.list_jobs()
 
-            assert result == response_data
+        assert result == response_data
 
     @pytest.mark.asyncio
-    async def test_list_jobs_error(self, client: NexrenderClient):
+    async def test_list_jobs_error(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 목록 조회 오류"""
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+        _wire(client, mock_http_client)
 
-            with pytest.raises(NexrenderError, match="작업 목록 조회 실패"):
-                await client.list_jobs()
+        with pytest.raises(NexrenderError, match="작업 목록 조회 실패"):
+            await client.list_jobs()
 
     @pytest.mark.asyncio
-    async def test_cancel_job_success(self, client: NexrenderClient):
+    async def test_cancel_job_success(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 취소 성공"""
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.delete = AsyncMock(return_value=mock_response)
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.delete = AsyncMock(return_value=mock_response)
+        _wire(client, mock_http_client)
 
-            result = await client.cancel_job("job-123")
+        result = await client.cancel_job("job-123")
 
-            assert result is True
-            mock_http_client.delete.assert_called_once_with("/api/v1/jobs/job-123")
+        assert result is True
+        mock_http_client.delete.assert_called_once_with("/api/v1/jobs/job-123")
 
     @pytest.mark.asyncio
-    async def test_cancel_job_204(self, client: NexrenderClient):
+    async def test_cancel_job_204(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 취소 성공 (204 응답)"""
         mock_response = MagicMock()
         mock_response.status_code = 204
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.delete = AsyncMock(return_value=mock_response)
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.delete = AsyncMock(return_value=mock_response)
+        _wire(client, mock_http_client)
 
-            result = await client.cancel_job("job-123")
+        result = await client.cancel_job("job-123")
 
-            assert result is True
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_cancel_job_failure(self, client: NexrenderClient):
+    async def test_cancel_job_failure(self, client: NexrenderClient, async_cm_client: AsyncMock):
         """작업 취소 실패"""
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = AsyncMock()
-            mock_http_client.delete = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-            mock_http_client.__aenter__ = AsyncMock(return_value=mock_http_client)
-            mock_http_client.__aexit__ = AsyncMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = async_cm_client
+        mock_http_client.delete = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+        _wire(client, mock_http_client)
 
-            result = await client.cancel_job("job-123")
+        result = await client.cancel_job("job-123")
 
-            assert result is False
+        assert result is False
 
 
 class TestNexrenderClientPollUntilComplete:
@@ -323,70 +327,51 @@ class TestNexrenderClientPollUntilComplete:
         """테스트용 클라이언트"""
         return NexrenderClient(base_url="http://localhost:3000")
 
+    @pytest.mark.parametrize(
+        ("get_job_return", "expected_error", "error_match"),
+        [
+            ({"uid": "job-123", "state": "finished", "renderProgress": 1.0}, None, None),
+            (
+                {"uid": "job-123", "state": "error", "error": "AE crashed"},
+                NexrenderError,
+                "렌더링 실패: AE crashed",
+            ),
+            (
+                {"uid": "job-123", "state": "rendering", "renderProgress": 0.5},
+                TimeoutError,
+                "렌더링 타임아웃",
+            ),
+        ],
+        ids=["finished", "error_state", "timeout"],
+    )
     @pytest.mark.asyncio
-    async def test_poll_until_complete_success(self, client: NexrenderClient):
-        """폴링 성공 (즉시 완료)"""
-        with patch.object(client, "get_job") as mock_get_job:
-            mock_get_job.return_value = {
-                "uid": "job-123",
-                "state": "finished",
-                "renderProgress": 1.0,
-            }
-
-            result = await client.poll_until_complete("job-123", poll_interval=0)
-
-            assert result["state"] == "finished"
-            mock_get_job.assert_called_once_with("job-123")
-
-    @pytest.mark.asyncio
-    async def test_poll_until_complete_with_callback(self, client: NexrenderClient):
-        """폴링 성공 (콜백 호출)"""
+    async def test_poll_until_complete(
+        self,
+        client: NexrenderClient,
+        get_job_return: dict,
+        expected_error: type[Exception] | None,
+        error_match: str | None,
+    ):
+        """폴링 결과별 동작 (완료 + 콜백 / 에러 상태 / 타임아웃)"""
         callback_calls: list[tuple[int, str]] = []
 
         def callback(progress: int, state: str):
             callback_calls.append((progress, state))
 
-        with patch.object(client, "get_job") as mock_get_job:
-            mock_get_job.return_value = {
-                "uid": "job-123",
-                "state": "finished",
-                "renderProgress": 1.0,
-            }
-
-            await client.poll_until_complete("job-123", callback=callback, poll_interval=0)
-
-            assert len(callback_calls) == 1
-            assert callback_calls[0] == (100, "finished")
+        with patch.object(client, "get_job", return_value=get_job_return) as mock_get_job:
+            poll = client.poll_until_complete(
+                "job-123", callback=callback, timeout=1, poll_interval=1
+            )
 
-    @pytest.mark.asyncio
-    async def test_poll_until_complete_error_state(self, client: NexrenderClient):
-        """폴링 실패 (에러 상태)"""
-        with patch.object(client, "get_job") as mock_get_job:
-            mock_get_job.return_value = {
-                "uid": "job-123",
-                "state": "error",
-                "error": "AE crashed",
-            }
-
-            with pytest.raises(NexrenderError, match="렌더링 실패: AE crashed"):
-                await client.poll_until_complete("job-123", poll_interval=0)
+            if expected_error is None:
+                result = await poll
 
-    @pytest.mark.asyncio
-    async def test_poll_until_complete_timeout(self, client: NexrenderClient):
-        """폴링 타임아웃"""
-        with patch.object(client, "get_job") as mock_get_job:
-            mock_get_job.return_value = {
-                "uid": "job-123",
-                "state": "rendering",
-                "renderProgress": 0.5,
-            }
-
-            with pytest.raises(TimeoutError, match="렌더링 타임아웃"):
-                await client.poll_until_complete(
-                    "job-123",
-                    timeout=1,
-                    poll_interval=1,
-                )
+                assert result["state"] == "finished"
+                mock_get_job.assert_called_once_with("job-123")
+                assert callback_calls == [(100, "finished")]
+            else:
+                with pytest.raises(expected_error, match=error_match):
+                    await poll
 
 
 class TestNexrenderSyncClient:
@@ -415,92 +400,68 @@ class TestNexrenderSyncClient:
     def test_submit_job_success(self, client: NexrenderSyncClient):
         """동기 작업 제출 성공"""
         job_data = {"template": {"src": "file://test.aep"}}
-        response_data = {"uid": "job-123", "state": "queued"}
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = response_data
-        mock_response.raise_for_status = MagicMock()
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = MagicMock()
-            mock_http_client.post.return_value = mock_response
-            mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
-            mock_http_client.__exit__ = MagicMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = MagicMock()
+        mock_http_client.post.return_value = _OK_QUEUED
+        mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
+        mock_http_client.__exit__ = MagicMock(return_value=None)
+        _wire(client, mock_http_client)
 
-            result = client.submit_job(job_data)
+        result = client.submit_job(job_data)
 
-            assert result == response_data
+        assert result == _QUEUED_JOB
 
     def test_submit_job_http_error(self, client: NexrenderSyncClient):
         """동기 작업 제출 HTTP 오류"""
         job_data = {"template": {"src": "file://test.aep"}}
 
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = MagicMock()
-            mock_http_client.post.side_effect = httpx.HTTPStatusError(
-                "Bad Request",
-                request=MagicMock(),
-                response=mock_response,
-            )
-            mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
-            mock_http_client.__exit__ = MagicMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = MagicMock()
+        mock_http_client.post.side_effect = httpx.HTTPStatusError(
+            "Bad Request",
+            request=MagicMock(),
+            response=_400,
+        )
+        mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
+        mock_http_client.__exit__ = MagicMock(return_value=None)
+        _wire(client, mock_http_client)
 
-            with pytest.raises(NexrenderError, match="작업 제출 실패"):
-                client.submit_job(job_data)
+        with pytest.raises(NexrenderError, match="작업 제출 실패"):
+            client.submit_job(job_data)
 
     def test_get_job_success(self, client: NexrenderSyncClient):
         """동기 작업 조회 성공"""
-        response_data = {"uid": "job-123", "state": "finished"}
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = response_data
-        mock_response.raise_for_status = MagicMock()
+        mock_http_client = MagicMock()
+        mock_http_client.get.return_value = _OK_FINISHED
+        mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
+        mock_http_client.__exit__ = MagicMock(return_value=None)
+        _wire(client, mock_http_client)
 
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = MagicMock()
-            mock_http_client.get.return_value = mock_response
-            mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
-            mock_http_client.__exit__ = MagicMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        result = client.get_job("job-123")
 
-            result = client.get_job("job-123")
-
-            assert result == response_data
+        assert result == _FINISHED_JOB
 
     def test_get_job_not_found(self, client: NexrenderSyncClient):
         """동기 작업 조회 - 404"""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = MagicMock()
-            mock_http_client.get.side_effect = httpx.HTTPStatusError(
-                "Not Found",
-                request=MagicMock(),
-                response=mock_response,
-            )
-            mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
-            mock_http_client.__exit__ = MagicMock(return_value=None)
-            mock_create.return_value = mock_http_client
+        mock_http_client = MagicMock()
+        mock_http_client.get.side_effect = httpx.HTTPStatusError(
+            "Not Found",
+            request=MagicMock(),
+            response=_404,
+        )
+        mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
+        mock_http_client.__exit__ = MagicMock(return_value=None)
+        _wire(client, mock_http_client)
 
-            with pytest.raises(NexrenderError, match="작업을 찾을 수 없습니다"):
-                client.get_job("nonexistent-job")
+        with pytest.raises(NexrenderError, match="작업을 찾을 수 없습니다"):
+            client.get_job("nonexistent-job")
 
     def test_get_job_connection_error(self, client: NexrenderSyncClient):
         """동기 작업 조회 연결 오류"""
-        with patch.object(client, "_create_client") as mock_create:
-            mock_http_client = MagicMock()
-            mock_http_client.get.side_effect = httpx.ConnectError("Connection refused")
-            mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
-            mock_http_client.__exit__ = MagicMock(return_value=None)
-            mock_create.return_value = mock_http_client
-
-            with pytest.raises(NexrenderError, match="Nexrender 서버 연결 실패"):
-                client.get_job("job-123")
+        mock_http_client = MagicMock()
+        mock_http_client.get.side_effect = httpx.ConnectError("Connection refused")
+        mock_http_client.__enter__ = MagicMock(return_value=mock_http_client)
+        mock_http_client.__exit__ = MagicMock(return_value=None)
+        _wire(client, mock_http_client)
+
+        with pytest.raises(NexrenderError, match="Nexrender 서버 연결 실패"):
+            client.get_job("job-123")
@@ -2,6 +2,8 @@
 ConfigStore 및 핫 리로드 테스트
 """
 
+import asyncio
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -11,6 +13,65 @@ import pytest
 import yaml
 
 
+def _write_test_config(tmpdir: Path) -> Path:
+    """테스트용 설정/매핑 파일 생성
+
+    Returns:
+        설정 파일 경로
+    """
+    # 설정 파일 생성
+    config_path = tmpdir / "api_config.yaml"
+    config_data = {
+        "version": "1.0.0",
+        "templates": {
+            "TestTemplate": {
+                "path": "/app/templates/Test.aep",
+                "mapping_file": str(tmpdir / "TestTemplate.yaml"),
+                "compositions": ["Main", "Secondary"],
+                "default_composition": "Main",
+            }
+        },
+        "db_schema": {
+            "table": "render_queue",
+            "field_mappings": {
+                "aep_project": "aep_project",
+                "status": "status",
+            },
+        },
+    }
+    # YAML은 JSON의 상위 집합이므로 json.dumps로 작성해도 safe_load로 파싱됨
+    config_path.write_text(json.dumps(config_data))
+
+    # 매핑 파일 생성
+    mapping_path = tmpdir / "TestTemplate.yaml"
+    mapping_data = {
+        "compositions": {
+            "Main": {
+                "field_mappings": {
+                    "event_name": "EVENT_LAYER",
+                    "title": "TITLE_LAYER",
+                }
+            }
+        }
+    }
+    mapping_path.write_text(json.dumps(mapping_data))
+
+    return config_path
+
+
+@pytest.fixture(scope="module")
+def loaded_store(tmp_path_factory):
+    """설정이 로드된 ConfigStore (읽기 전용 테스트에서 모듈 단위 공유)"""
+    from config.config_manager import ConfigStore
+
+    config_path = _write_test_config(tmp_path_factory.mktemp("config"))
+
+    ConfigStore._instance = None
+    store = ConfigStore()
+    asyncio.run(store.reload(str(config_path)))
+    return store
+
+
 class TestConfigStore:
     """ConfigStore 테스트"""
 
@@ -18,44 +79,7 @@ class TestConfigStore:
     def temp_config_dir(self):
         """임시 설정 디렉토리"""
         with tempfile.TemporaryDirectory() as tmpdir:
-            # 설정 파일 생성
-            config_path = Path(tmpdir) / "api_config.yaml"
-            config_data = {
-                "version": "1.0.0",
-                "templates": {
-                    "TestTemplate": {
-                        "path": "/app/templates/Test.aep",
-                        "mapping_file": str(Path(tmpdir) / "TestTemplate.yaml"),
-                        "compositions": ["Main", "Secondary"],
-                        "default_composition": "Main",
-                    }
-                },
-                "db_schema": {
-                    "table": "render_queue",
-                    "field_mappings": {
-                        "aep_project": "aep_project",
-                        "status": "status",
-                    },
-                },
-            }
-            with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
-
-            # 매핑 파일 생성
-            mapping_path = Path(tmpdir) / "TestTemplate.yaml"
-            mapping_data = {
-                "compositions": {
-                    "Main": {
-                        "field_mappings": {
-                            "event_name": "EVENT_LAYER",
-                            "title": "TITLE_LAYER",
-                        }
-                    }
-                }
-            }
-            with open(mapping_path, "w") as f:
-                yaml.dump(mapping_data, f)
-
+            config_path = _write_test_config(Path(tmpdir))
             yield tmpdir, str(config_path)
 
     @pytest.mark.asyncio
@@ -74,63 +98,33 @@ class TestConfigStore:
         assert store.version == "1.0.0"
         assert "TestTemplate" in store._templates
 
-    @pytest.mark.asyncio
-    async def test_get_template(self, temp_config_dir):
+    def test_get_template(self, loaded_store):
         """템플릿 조회 테스트"""
-        tmpdir, config_path = temp_config_dir
-
-        from config.config_manager import ConfigStore
-
-        ConfigStore._instance = None
-
-        store = ConfigStore()
-        await store.reload(config_path)
-
-        template = store.get_template("TestTemplate")
+        template = loaded_store.get_template("TestTemplate")
         assert template is not None
         assert template.name == "TestTemplate"
         assert template.path == "/app/templates/Test.aep"
         assert "Main" in template.compositions
 
-    @pytest.mark.asyncio
-    async def test_get_layer_mapping(self, temp_config_dir):
+    def test_get_layer_mapping(self, loaded_store):
         """레이어 매핑 조회 테스트"""
-        tmpdir, config_path = temp_config_dir
-
-        from config.config_manager import ConfigStore
-
-        ConfigStore._instance = None
-
-        store = ConfigStore()
-        await store.reload(config_path)
-
         # 매핑 조회
-        layer_name = store.get_layer_mapping("TestTemplate", "Main", "event_name")
+        layer_name = loaded_store.get_layer_mapping("TestTemplate", "Main", "event_name")
         assert layer_name == "EVENT_LAYER"
 
         # 없는 필드
-        layer_name = store.get_layer_mapping("TestTemplate", "Main", "nonexistent")
+        layer_name = loaded_store.get_layer_mapping("TestTemplate", "Main", "nonexistent")
         assert layer_name is None
 
-    @pytest.mark.asyncio
-    async def test_map_api_to_db(self, temp_config_dir):
+    def test_map_api_to_db(self, loaded_store):
         """API → DB 필드 매핑 테스트"""
-        tmpdir, config_path = temp_config_dir
-
-        from config.config_manager import ConfigStore
-
-        ConfigStore._instance = None
-
-        store = ConfigStore()
-        await store.reload(config_path)
-
         api_data = {
             "aep_project": "/app/test.aep",
             "status": "pending",
             "custom_field": "value",  # 매핑 없음
         }
 
-        db_data = store.map_api_to_db(api_data)
+        db_data = loaded_store.map_api_to_db(api_data)
 
         assert db_data["aep_project"] == "/app/test.aep"
         assert db_data["status"] == "pending"
@@ -208,16 +202,3 @@ class TestConfigStore:
             # 기본 설정으로 생성됨
             assert store.version == "1.0.0"
             assert config_path.exists()
-
-
-class TestConfigWatcher:
-    """ConfigWatcher 핫 리로드 테스트"""
-
-    @pytest.mark.asyncio
-    async def test_watcher_detects_change(self):
-        """파일 변경 감지 테스트 (watchdog 설치 시)"""
-        pytest.importorskip("watchdog")
-
-        # 이 테스트는 실제 파일 시스템 이벤트가 필요하므로
-        # 통합 테스트에서 수행하는 것이 좋음
-        pass
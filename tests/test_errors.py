@@ -6,6 +6,7 @@
 
 import pytest
 
+from lib import errors
 from lib.errors import (
     NON_RETRYABLE_PATTERNS,
     RETRYABLE_PATTERNS,
@@ -110,6 +111,18 @@ class TestErrorPatterns:
 
         assert category == ErrorCategory.NON_RETRYABLE
 
+    @pytest.mark.parametrize(
+        "text",
+        ["Connection TIMEOUT", "HTTP 404", "all good", "Missing File: a.png", ""],
+    )
+    def test_regex_fallback_matches_automaton(self, text: str, monkeypatch):
+        """pyahocorasick 미설치 시 정규식 매처도 같은 결과"""
+        default_match = errors._build_matcher(RETRYABLE_PATTERNS + NON_RETRYABLE_PATTERNS)
+        monkeypatch.setattr(errors, "ahocorasick", None)
+        regex_match = errors._build_matcher(RETRYABLE_PATTERNS + NON_RETRYABLE_PATTERNS)
+
+        assert regex_match(text) == default_match(text)
+
 
 class TestErrorFormatMessage:
     """에러 메시지 포맷팅 테스트"""
@@ -154,6 +167,17 @@ class TestErrorFormatMessage:
             assert "상세 정보:" in message
             assert "Traceback" in message
 
+    def test_format_message_outside_except_block(self):
+        """except 블록 밖에서 포맷해도 traceback 포함"""
+        try:
+            raise ValueError("Test error")
+        except ValueError as e:
+            error = e
+
+        message = ErrorClassifier.format_message(error, include_traceback=True)
+        assert "Traceback" in message
+        assert "Test error" in message
+
 
 class TestNexrenderError:
     """NexrenderError 커스텀 예외 테스트"""
@@ -178,6 +202,43 @@ class TestNexrenderError:
 
         assert category == ErrorCategory.RETRYABLE
 
+    def test_nexrender_error_explicit_category_wins(self):
+        """카테고리가 명시된 NexrenderError는 패턴 매칭보다 우선"""
+        error = NexrenderError("Connection timeout", category=ErrorCategory.NON_RETRYABLE)
+        category = ErrorClassifier.classify(error)
+
+        assert category == ErrorCategory.NON_RETRYABLE
+
+    def test_classify_same_error_uses_cache(self):
+        """동일 (타입, 메시지) 재분류 시 캐시 결과 사용"""
+        from lib.errors import _classify_cached
+
+        _classify_cached.cache_clear()
+        ErrorClassifier.classify(ConnectionError("Connection refused"))
+        ErrorClassifier.classify(ConnectionError("Connection refused"))
+
+        info = _classify_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_classify_many_messages(self):
+        """메시지 목록 일괄 분류 (입력 순서 유지)"""
+        categories = ErrorClassifier.classify_many(
+            [
+                "Connection refused",
+                "Template file not found",
+                "Something weird happened",
+                "Connection refused",
+            ]
+        )
+
+        assert categories == [
+            ErrorCategory.RETRYABLE,
+            ErrorCategory.NON_RETRYABLE,
+            ErrorCategory.UNKNOWN,
+            ErrorCategory.RETRYABLE,
+        ]
+
 
 class TestRealWorldScenarios:
     """실제 시나리오 테스트"""
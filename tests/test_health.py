@@ -0,0 +1,48 @@
+"""
+HealthServer 단위 테스트
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from worker.health import HealthServer
+
+
+@pytest.fixture
+def health_server() -> HealthServer:
+    """Mock 워커를 참조하는 HealthServer"""
+    worker = MagicMock()
+    worker.worker_id = "test-worker-123"
+    worker.running = True
+    worker.current_job_id = None
+    return HealthServer(worker)
+
+
+class TestHealthHandler:
+    """GET /health 핸들러 테스트"""
+
+    async def test_health_response(self, health_server: HealthServer):
+        """워커 상태와 uptime 반환"""
+        health_server.started_ns -= 90 * 1_000_000_000  # 90초 전 시작
+
+        response = await health_server._health_handler(MagicMock())
+
+        assert response.status == 200
+        assert response.content_type == "application/json"
+        assert json.loads(response.body) == {
+            "status": "ok",
+            "worker_id": "test-worker-123",
+            "running": True,
+            "current_job_id": None,
+            "uptime_seconds": 90,
+        }
+
+    async def test_health_reflects_current_job(self, health_server: HealthServer):
+        """처리 중인 작업 ID 반영"""
+        health_server.worker.current_job_id = "job-123"
+
+        response = await health_server._health_handler(MagicMock())
+
+        assert json.loads(response.body)["current_job_id"] == "job-123"
@@ -4,9 +4,13 @@ JobBuilder 단위 테스트
 GFX 데이터와 템플릿 기반 Job JSON 생성 테스트.
 """
 
+import dataclasses
 from typing import Any
+from unittest.mock import MagicMock
 
-from lib.job_builder import JobConfig, NexrenderJobBuilder
+import pytest
+
+from lib.job_builder import AssetIndex, JobConfig, NexrenderJobBuilder
 
 
 class TestJobConfig:
@@ -36,6 +40,18 @@ class TestJobConfig:
         assert config.output_dir == "C:/output"
         assert config.callback_url == "http://localhost:8000/callback"
 
+    def test_config_is_immutable(self):
+        """생성 후 변경 불가 (파생 필드 output_ext 일관성 유지)"""
+        config = JobConfig(
+            aep_project_path="C:/test/test.aep",
+            composition_name="Main",
+            output_format="mov_alpha",
+        )
+        assert config.output_ext == "mov"
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.output_format = "mp4"
+
 
 class TestBuildFromGFXData:
     """GFX 데이터 기반 Job 빌드 테스트"""
@@ -77,15 +93,37 @@ class TestBuildFromGFXData:
         assert any(a["value"] == "Table 1" for a in single_assets)
         assert any(a["value"] == "WSOP 2024" for a in single_assets)
 
+        # data 값 집합
+        assert {"PHIL IVEY", "1,234,567", "Table 1", "WSOP 2024"} <= AssetIndex(result).data_values
+
         # Actions 검증
         assert "postrender" in result["actions"]
         copy_action = result["actions"]["postrender"][0]
         assert copy_action["module"] == "@nexrender/action-copy"
         assert "C:/output/test-job-001.mp4" in copy_action["output"]
 
-    def test_build_multi_slot_gfx_data(
-        self, sample_gfx_data_multi_slot: dict[str, Any]
-    ):
+    def test_build_with_list_valued_data_asset(self, sample_gfx_data: dict[str, Any]):
+        """metadata로 병합된 리스트 값 data asset이 있어도 빌드 가능"""
+        config = JobConfig(
+            aep_project_path="C:/templates/test.aep",
+            composition_name="Main",
+            output_dir="C:/output",
+        )
+        builder = NexrenderJobBuilder(config)
+        position = {
+            "type": "data",
+            "layerName": "logo",
+            "property": "Position",
+            "value": [960, 540],
+        }
+        gfx_data = {**sample_gfx_data, "metadata": {"assets": [position]}}
+
+        result = builder.build_from_gfx_data(gfx_data, "list-value")
+
+        assert position in result["assets"]
+        assert "PHIL IVEY" in AssetIndex(result).data_values
+
+    def test_build_multi_slot_gfx_data(self, sample_gfx_data_multi_slot: dict[str, Any]):
         """여러 슬롯 GFX 데이터에서 Job JSON 생성"""
         config = JobConfig(
             aep_project_path="C:/templates/test.aep",
@@ -103,11 +141,11 @@ class TestBuildFromGFXData:
         assert len(slot_assets) == 16
 
         # 슬롯별로 검증
+        index = AssetIndex(result)
         for i in range(1, 9):
-            slot_name_asset = next(
-                a for a in assets if a["layerName"] == f"slot{i}_name"
-            )
-            assert slot_name_asset["value"] == f"Player {i}"
+            assert index.get_asset(f"slot{i}_name")["value"] == f"Player {i}"
+
+        assert index.get_asset("nonexistent_layer") is None
 
     def test_build_with_images(self, sample_gfx_data_with_images: dict[str, Any]):
         """이미지 에셋 포함 GFX 데이터에서 Job JSON 생성"""
@@ -120,10 +158,8 @@ class TestBuildFromGFXData:
 
         result = builder.build_from_gfx_data(sample_gfx_data_with_images, "with-images")
 
-        assets = result["assets"]
-
         # 이미지 에셋 확인
-        image_assets = [a for a in assets if a.get("type") == "image"]
+        image_assets = AssetIndex(result).get_assets_by_type("image")
         assert len(image_assets) == 1
         assert image_assets[0]["layerName"] == "background_image"
         assert "file:///" in image_assets[0]["src"]
@@ -178,23 +214,51 @@ class TestBuildFromTemplate:
         result = builder.build_from_template(sample_template, sample_layer_data, 123)
 
         # Assets 검증
-        assets = result["assets"]
+        assert len(result["assets"]) == 4
+
+        index = AssetIndex(result)
 
         # 텍스트 레이어
-        text_assets = [a for a in assets if a["type"] == "data"]
+        text_assets = index.get_assets_by_type("data")
         assert len(text_assets) == 2
         assert any(
-            a["layerName"] == "player1_name" and a["value"] == "PHIL IVEY"
-            for a in text_assets
+            a["layerName"] == "player1_name" and a["value"] == "PHIL IVEY" for a in text_assets
         )
 
         # 이미지 레이어
-        image_assets = [a for a in assets if a["type"] == "image"]
+        image_assets = index.get_assets_by_type("image")
         assert len(image_assets) == 2
         assert any(a["layerName"] == "background_image" for a in image_assets)
         assert any(a["layerName"] == "logo" for a in image_assets)
 
 
+class TestAssetIndex:
+    """AssetIndex 테스트"""
+
+    def test_index_built_on_first_lookup(self):
+        """인덱스는 첫 조회 시점에 생성"""
+        job = {
+            "assets": [
+                {"type": "data", "layerName": "title", "value": "WSOP"},
+                {"type": "image", "layerName": "logo", "src": "file:///logo.png"},
+            ]
+        }
+        index = AssetIndex(job)
+        assert "_type_index" not in vars(index)
+
+        assert index.get_assets_by_type("image") == [job["assets"][1]]
+        assert "_type_index" in vars(index)
+        assert index.data_values == frozenset({"WSOP"})
+        assert index.get_asset("logo") is job["assets"][1]
+
+    def test_missing_assets(self):
+        """assets가 없는 Job"""
+        index = AssetIndex({})
+
+        assert index.get_assets_by_type("data") == []
+        assert index.data_values == frozenset()
+
+
 class TestPrivateMethods:
     """내부 메서드 테스트"""
 
@@ -230,3 +294,12 @@ class TestPrivateMethods:
         builder = NexrenderJobBuilder(config)
 
         assert builder._get_output_extension() == "png"
+
+    def test_get_mapped_layer_name_non_string_mapping(self):
+        """YAML 매핑 값이 숫자여도 그대로 반환"""
+        config = JobConfig(aep_project_path="C:/test.aep", composition_name="Main")
+        mapping_loader = MagicMock()
+        mapping_loader.get_layer_name.return_value = 1
+        builder = NexrenderJobBuilder(config, mapping_loader=mapping_loader)
+
+        assert builder._get_mapped_layer_name("event_name") == 1
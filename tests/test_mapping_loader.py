@@ -0,0 +1,70 @@
+"""
+MappingLoader 테스트
+
+매핑 파일 로드 및 파싱 캐시 동작을 테스트합니다.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from lib.mapping_loader import MappingLoader, _parse_mapping_file, slot_field_prefix
+
+
+def _write_mapping(path: Path, layer_name: str) -> None:
+    """단일 필드 매핑 파일 작성"""
+    mapping = {"compositions": {"Main": {"field_mappings": {"event_name": layer_name}}}}
+    path.write_text(json.dumps(mapping), encoding="utf-8")
+
+
+@pytest.fixture
+def mappings_dir(tmp_path: Path) -> Path:
+    """YAML/JSON 매핑 파일이 있는 임시 디렉토리"""
+    _write_mapping(tmp_path / "YamlTemplate.yaml", "EVENT_YAML")
+    _write_mapping(tmp_path / "JsonTemplate.json", "EVENT_JSON")
+    _parse_mapping_file.cache_clear()
+    return tmp_path
+
+
+class TestMappingLoader:
+    """MappingLoader 테스트"""
+
+    def test_load_yaml_and_json(self, mappings_dir: Path) -> None:
+        """YAML/JSON 매핑 파일 로드"""
+        loader = MappingLoader(str(mappings_dir))
+
+        assert loader.get_layer_name("YamlTemplate", "Main", "event_name") == "EVENT_YAML"
+        assert loader.get_layer_name("JsonTemplate", "Main", "event_name") == "EVENT_JSON"
+        assert loader.load("Missing") == {}
+
+    def test_new_instance_reuses_parsed_file(self, mappings_dir: Path) -> None:
+        """새 인스턴스도 파싱 결과 재사용 (작업마다 빌더 생성하는 워커 시나리오)"""
+        MappingLoader(str(mappings_dir)).load("YamlTemplate")
+        MappingLoader(str(mappings_dir)).load("YamlTemplate")
+
+        info = _parse_mapping_file.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_reload_picks_up_modified_file(self, mappings_dir: Path) -> None:
+        """파일 수정 시 reload로 새 내용 반영"""
+        loader = MappingLoader(str(mappings_dir))
+        assert loader.get_layer_name("YamlTemplate", "Main", "event_name") == "EVENT_YAML"
+
+        path = mappings_dir / "YamlTemplate.yaml"
+        _write_mapping(path, "EVENT_CHANGED")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        loader.reload("YamlTemplate")
+        assert loader.get_layer_name("YamlTemplate", "Main", "event_name") == "EVENT_CHANGED"
+
+
+@pytest.mark.parametrize(
+    ("slot_index", "prefix"), [(1, "slot1_"), (32, "slot32_"), (40, "slot40_")]
+)
+def test_slot_field_prefix(slot_index: int, prefix: str) -> None:
+    """사전 생성 범위 밖 슬롯도 같은 형식의 접두사 반환"""
+    assert slot_field_prefix(slot_index) == prefix
@@ -135,9 +135,7 @@ class TestMappingValidator:
         assert result.is_valid is True
         assert "slot1_name" in result.matched_fields or "slot1_name" in result.fallback_fields
 
-    def test_extract_gfx_fields_single_fields_only(
-        self, validator: MappingValidator
-    ) -> None:
+    def test_extract_gfx_fields_single_fields_only(self, validator: MappingValidator) -> None:
         """single_fields만 있는 GFX 데이터에서 필드 추출"""
         gfx_data = {
             "single_fields": {
@@ -171,6 +169,20 @@ class TestMappingValidator:
         assert "slot2_chips" in fields
         assert len(fields) == 5
 
+    def test_extract_gfx_fields_slot_index_out_of_prefix_range(
+        self, validator: MappingValidator
+    ) -> None:
+        """사전 생성 접두사 범위 밖 slot_index도 동일 형식으로 추출"""
+        gfx_data = {
+            "slots": [
+                {"slot_index": 0, "fields": {"name": "A"}},
+                {"slot_index": 40, "fields": {"name": "B"}},
+            ],
+        }
+
+        fields = validator._extract_gfx_fields(gfx_data)
+        assert fields == {"slot0_name", "slot40_name"}
+
     def test_validate_empty_gfx_data(self, validator: MappingValidator) -> None:
         """빈 GFX 데이터 검증"""
         gfx_data: dict = {}
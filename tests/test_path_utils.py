@@ -4,7 +4,7 @@
 Docker ↔ Windows 경로 변환, file:// URL 변환 테스트.
 """
 
-from lib.path_utils import PathConverter, PathMapping
+from lib.path_utils import PathConverter, PathMapping, _to_windows_path
 
 
 class TestPathConverter:
@@ -15,9 +15,7 @@ class TestPathConverter:
         docker_path = "/app/templates/CyprusDesign/CyprusDesign.aep"
         result = path_converter.to_windows_path(docker_path)
 
-        assert (
-            result == "C:/claude/automation_ae/templates/CyprusDesign/CyprusDesign.aep"
-        )
+        assert result == "C:/claude/automation_ae/templates/CyprusDesign/CyprusDesign.aep"
 
     def test_to_windows_path_output(self, path_converter: PathConverter):
         """Docker 경로 → Windows 경로 (출력)"""
@@ -121,18 +119,52 @@ class TestCustomMappings:
 
         # Docker → Windows
         assert converter.to_windows_path("/mnt/data/file.txt") == "D:/Data/file.txt"
-        assert (
-            converter.to_windows_path("/mnt/projects/src/main.py")
-            == "E:/Projects/src/main.py"
-        )
+        assert converter.to_windows_path("/mnt/projects/src/main.py") == "E:/Projects/src/main.py"
 
         # Windows → Docker
         assert converter.to_docker_path("D:/Data/file.txt") == "/mnt/data/file.txt"
-        assert (
-            converter.to_docker_path("E:/Projects/src/main.py")
-            == "/mnt/projects/src/main.py"
+        assert converter.to_docker_path("E:/Projects/src/main.py") == "/mnt/projects/src/main.py"
+
+    def test_mappings_snapshot(self):
+        """생성 후 원본 리스트를 변경해도 매핑은 그대로"""
+        custom_mappings = [PathMapping("/mnt/data", "D:/Data")]
+        converter = PathConverter(mappings=custom_mappings)
+
+        custom_mappings.append(PathMapping("/mnt/other", "F:/Other"))
+
+        assert converter.mappings == (PathMapping("/mnt/data", "D:/Data"),)
+        assert converter.to_windows_path("/mnt/other/file.txt") == "/mnt/other/file.txt"
+
+    def test_overlapping_mappings_first_declared_wins(self):
+        """접두사가 겹치면 먼저 선언된 매핑 우선"""
+        converter = PathConverter(
+            mappings=[
+                PathMapping("/mnt", "D:/Mount"),
+                PathMapping("/mnt/data", "E:/Data"),
+            ]
         )
 
+        assert converter.to_windows_path("/mnt/data/file.txt") == "D:/Mount/data/file.txt"
+
+    def test_regex_special_chars_in_prefix(self):
+        """매핑 접두사의 정규식 특수문자는 문자 그대로 비교"""
+        converter = PathConverter(mappings=[PathMapping("/app/v1.0", "C:/v1.0")])
+
+        assert converter.to_windows_path("/app/v1.0/file.aep") == "C:/v1.0/file.aep"
+        assert converter.to_windows_path("/app/v1x0/file.aep") == "/app/v1x0/file.aep"
+
+    def test_conversion_cache_shared_across_instances(self):
+        """같은 매핑의 인스턴스끼리 변환 캐시 공유"""
+        _to_windows_path.cache_clear()
+
+        first = PathConverter().to_windows_path("/app/output/render.mp4")
+        second = PathConverter().to_windows_path("/app/output/render.mp4")
+        other = PathConverter(mappings=[PathMapping("/app/output", "D:/out")])
+
+        assert first == second == "C:/claude/automation_ae/output/render.mp4"
+        assert _to_windows_path.cache_info().hits == 1
+        assert other.to_windows_path("/app/output/render.mp4") == "D:/out/render.mp4"
+
     def test_empty_mappings(self):
         """빈 매핑 리스트 (DEFAULT_MAPPINGS 사용)"""
         # mappings=None이면 DEFAULT_MAPPINGS 사용
@@ -0,0 +1,248 @@
+"""
+SupabaseQueueClient 단위 테스트
+
+supabase Client를 Mock으로 대체하여 요청 형태를 검증합니다.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from postgrest import ReturnMethod
+
+from worker.config import WorkerConfig
+from worker.supabase_client import _CLAIM_COLUMNS, SupabaseQueueClient
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    """supabase Client Mock"""
+    return MagicMock()
+
+
+@pytest.fixture
+def queue_client(mock_client: MagicMock) -> SupabaseQueueClient:
+    """Mock Client를 사용하는 SupabaseQueueClient"""
+    config = WorkerConfig(
+        supabase_url="https://test.supabase.co",
+        supabase_service_key="key",
+    )
+    with patch("worker.supabase_client.create_client", return_value=mock_client):
+        return SupabaseQueueClient(config)
+
+
+class TestExecute:
+    """동기 요청 실행 테스트"""
+
+    async def test_execute_runs_off_event_loop_thread(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """supabase-py 호출은 이벤트 루프 스레드를 막지 않음"""
+        loop_thread = threading.get_ident()
+        execute_threads = []
+
+        def _execute():
+            execute_threads.append(threading.get_ident())
+            return SimpleNamespace(data=[{"id": "job-1"}])
+
+        mock_client.table.return_value.select.return_value.eq.return_value.execute = _execute
+
+        assert await queue_client.get_job("job-1") == {"id": "job-1"}
+        assert execute_threads and execute_threads[0] != loop_thread
+
+
+class TestClaimPendingJob:
+    """claim_pending_job 테스트"""
+
+    async def test_claim_single_rpc(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """RPC 1회 호출로 작업 할당"""
+        job = {"id": "job-1", "status": "preparing"}
+        rpc = mock_client.rpc.return_value
+        rpc.select.return_value.execute.return_value = SimpleNamespace(data=[job])
+
+        assert await queue_client.claim_pending_job("worker-1") == job
+
+        mock_client.rpc.assert_called_once_with(
+            "claim_pending_render_job",
+            {"p_worker_id": "worker-1", "p_worker_host": queue_client.worker_host},
+        )
+        rpc.select.assert_called_once_with(*_CLAIM_COLUMNS)
+        mock_client.table.assert_not_called()
+
+    async def test_claim_no_pending_job(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """대기 작업이 없으면 None"""
+        mock_client.rpc.return_value.select.return_value.execute.return_value = SimpleNamespace(
+            data=[]
+        )
+
+        assert await queue_client.claim_pending_job("worker-1") is None
+
+
+class TestJsonbMerge:
+    """metadata/error_details 원자적 병합 테스트 (get_job 조회 없음)"""
+
+    async def test_set_nexrender_job_id(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """nexrender_job_id는 metadata 병합 RPC 1회"""
+        await queue_client.set_nexrender_job_id("job-1", "uid-1")
+
+        mock_client.rpc.assert_called_once_with(
+            "merge_render_job_metadata",
+            {"p_job_id": "job-1", "p_patch": {"nexrender_job_id": "uid-1"}},
+        )
+        mock_client.table.return_value.select.assert_not_called()
+
+    async def test_update_progress_with_state(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """nexrender_state는 metadata에 병합하고 컬럼에는 쓰지 않음"""
+        await queue_client.update_progress("job-1", 50, nexrender_state="rendering")
+
+        mock_client.table.return_value.update.assert_called_once_with(
+            {"progress": 50}, returning=ReturnMethod.minimal
+        )
+        mock_client.rpc.assert_called_once_with(
+            "merge_render_job_metadata",
+            {"p_job_id": "job-1", "p_patch": {"nexrender_state": "rendering"}},
+        )
+
+    async def test_update_progress_requests_overlap(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """진행률 UPDATE와 metadata 병합은 동시에 진행"""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def _execute():
+            both_started.wait()  # 순차 실행이면 BrokenBarrierError
+            return SimpleNamespace(data=[])
+
+        mock_client.table.return_value.update.return_value.eq.return_value.execute = _execute
+        mock_client.rpc.return_value.execute = _execute
+
+        await queue_client.update_progress("job-1", 50, nexrender_state="rendering")
+
+    async def test_mark_failed(self, queue_client: SupabaseQueueClient, mock_client: MagicMock):
+        """재시도 판단은 fail_render_job RPC에 위임"""
+        job = {"id": "job-1", "status": "pending"}
+        mock_client.rpc.return_value.select.return_value.execute.return_value = SimpleNamespace(
+            data=[job]
+        )
+
+        result = await queue_client.mark_failed(
+            "job-1", "timeout", error_category="retryable", should_retry=True
+        )
+
+        assert result == job
+        mock_client.rpc.assert_called_once_with(
+            "fail_render_job",
+            {
+                "p_job_id": "job-1",
+                "p_error_message": "timeout",
+                "p_error_category": "retryable",
+                "p_should_retry": True,
+            },
+        )
+
+    async def test_mark_failed_missing_job(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """작업이 없으면 ValueError"""
+        mock_client.rpc.return_value.select.return_value.execute.return_value = SimpleNamespace(
+            data=[]
+        )
+
+        with pytest.raises(ValueError):
+            await queue_client.mark_failed("missing", "error")
+
+    async def test_release_job(self, queue_client: SupabaseQueueClient, mock_client: MagicMock):
+        """락 해제는 release_render_job RPC 1회"""
+        await queue_client.release_job("job-1")
+
+        mock_client.rpc.assert_called_once_with("release_render_job", {"p_job_id": "job-1"})
+        mock_client.table.assert_not_called()
+
+
+class TestSubscribeNewJobs:
+    """Realtime 새 작업 알림 구독 테스트"""
+
+    async def test_subscribe_invokes_callback_on_insert(self, queue_client: SupabaseQueueClient):
+        """pending INSERT 알림 시 콜백 호출"""
+        realtime = MagicMock()
+        realtime.connect = AsyncMock()
+        realtime.close = AsyncMock()
+        channel = realtime.channel.return_value
+        channel.subscribe = AsyncMock()
+        on_new_job = MagicMock()
+
+        with patch("worker.supabase_client.AsyncRealtimeClient", return_value=realtime):
+            assert await queue_client.subscribe_new_jobs(on_new_job) is True
+
+        event, callback = channel.on_postgres_changes.call_args.args
+        assert event == "INSERT"
+        assert channel.on_postgres_changes.call_args.kwargs["filter"] == "status=eq.pending"
+        callback({"record": {"id": "job-1"}})
+        on_new_job.assert_called_once_with()
+
+        await queue_client.close()
+        realtime.close.assert_awaited_once()
+
+    async def test_subscribe_failure_falls_back(self, queue_client: SupabaseQueueClient):
+        """연결 실패 시 False 반환 (폴링만 사용)"""
+        realtime = MagicMock()
+        realtime.connect = AsyncMock(side_effect=OSError("connection refused"))
+        realtime.close = AsyncMock()
+
+        with patch("worker.supabase_client.AsyncRealtimeClient", return_value=realtime):
+            assert await queue_client.subscribe_new_jobs(MagicMock()) is False
+
+        realtime.close.assert_awaited_once()
+        await queue_client.close()
+        realtime.close.assert_awaited_once()
+
+
+class TestMarkCompleted:
+    """mark_completed 테스트"""
+
+    async def test_single_patch(self, queue_client: SupabaseQueueClient, mock_client: MagicMock):
+        """완료 처리는 UPDATE 1회"""
+        update = mock_client.table.return_value.update
+        update.return_value.eq.return_value.select.return_value.execute.return_value = (
+            SimpleNamespace(data=[{"id": "job-1", "status": "completed"}])
+        )
+
+        result = await queue_client.mark_completed(
+            "job-1", "C:/output/job-1.mp4", output_file_size=2048
+        )
+
+        assert result == {"id": "job-1", "status": "completed"}
+        update_data = update.call_args.args[0]
+        assert update_data["status"] == "completed"
+        assert update_data["progress"] == 100
+        assert update_data["output_file_size"] == 2048
+        assert update_data["worker_id"] is None
+        update.assert_called_once()
+
+
+class TestGetPendingCount:
+    """get_pending_count 캐시 테스트"""
+
+    async def test_count_cached_within_ttl(
+        self, queue_client: SupabaseQueueClient, mock_client: MagicMock
+    ):
+        """유효 시간 내에는 COUNT 재조회 생략, max_age=0이면 항상 조회"""
+        query = mock_client.table.return_value.select.return_value.eq.return_value
+        query.execute.return_value = SimpleNamespace(data=[], count=3)
+
+        assert await queue_client.get_pending_count() == 3
+        assert await queue_client.get_pending_count() == 3
+        assert query.execute.call_count == 1
+
+        query.execute.return_value = SimpleNamespace(data=[], count=4)
+        assert await queue_client.get_pending_count(max_age=0) == 4
+        assert query.execute.call_count == 2
@@ -0,0 +1,173 @@
+"""
+WorkerConfig 단위 테스트
+
+환경변수 기반 설정 로드 테스트.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from lib.path_utils import PathMapping
+from worker.config import (
+    ConfigurationError,
+    ValidationLevel,
+    WorkerConfig,
+    _parse_path_mappings,
+)
+
+
+class TestParsePathMappings:
+    """PATH_MAPPINGS 파싱 테스트"""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("", []),
+            (
+                "/app/templates:C:/templates",
+                [PathMapping("/app/templates", "C:/templates")],
+            ),
+            (
+                " /app/templates : C:/templates , /app/output:D:/output",
+                [
+                    PathMapping("/app/templates", "C:/templates"),
+                    PathMapping("/app/output", "D:/output"),
+                ],
+            ),
+            # ":"가 없는 항목과 빈 항목은 무시
+            ("invalid,,/nas:D:/nas,", [PathMapping("/nas", "D:/nas")]),
+        ],
+        ids=["empty", "single", "strip_whitespace", "skip_invalid"],
+    )
+    def test_parse(self, value: str, expected: list[PathMapping]):
+        """첫 번째 ":" 기준으로 Docker/Windows 경로 분리"""
+        assert _parse_path_mappings(value) == expected
+
+
+class TestFromEnv:
+    """WorkerConfig.from_env 테스트"""
+
+    def test_from_env(self):
+        """환경변수 값 반영"""
+        env = {
+            "SUPABASE_URL": "https://test.supabase.co",
+            "RENDER_TIMEOUT": "600",
+            "PATH_MAPPINGS": "/app/templates:C:/templates",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            config = WorkerConfig.from_env()
+
+        assert config.supabase_url == "https://test.supabase.co"
+        assert config.render_timeout == 600
+        assert config.nexrender_url == "http://localhost:3000"  # 기본값
+        assert config.path_mappings == [PathMapping("/app/templates", "C:/templates")]
+
+    def test_from_env_default_path_mappings(self):
+        """PATH_MAPPINGS 미설정 시 기본 매핑 사용"""
+        with patch.dict("os.environ", {}, clear=True):
+            config = WorkerConfig.from_env()
+
+        assert config.path_mappings == WorkerConfig().path_mappings
+
+
+class TestValidate:
+    """WorkerConfig.validate 경로 검증 테스트"""
+
+    def test_missing_paths_warn(self, tmp_path):
+        """없는 경로는 경고로 반환 (검증 순서 유지)"""
+        config = WorkerConfig(
+            supabase_url="https://test.supabase.co",
+            supabase_service_key="key",
+            output_dir=str(tmp_path),
+            aep_template_dir=str(tmp_path / "missing_templates"),
+            nas_output_path="//missing-nas/renders",
+        )
+
+        messages = config.validate()
+
+        assert messages == [
+            f"템플릿 디렉토리 없음: {tmp_path / 'missing_templates'}",
+            "NAS 경로 접근 불가 (나중에 확인 필요): //missing-nas/renders",
+        ]
+
+    def test_unresponsive_path_does_not_block(self, tmp_path, monkeypatch):
+        """응답 없는 NAS 경로는 제한 시간 후 경고 처리"""
+        import threading
+
+        import worker.config as worker_config
+
+        release = threading.Event()
+
+        class SlowNasPath(type(tmp_path)):
+            def exists(self, **kwargs):
+                if str(self).startswith("//"):
+                    release.wait()
+                return super().exists(**kwargs)
+
+        monkeypatch.setattr(worker_config, "Path", SlowNasPath)
+        monkeypatch.setattr(worker_config, "_PATH_CHECK_TIMEOUT", 0.05)
+
+        config = WorkerConfig(
+            supabase_url="https://test.supabase.co",
+            supabase_service_key="key",
+            output_dir=str(tmp_path),
+            aep_template_dir=str(tmp_path),
+            nas_output_path="//slow-nas/renders",
+        )
+        try:
+            messages = config.validate()
+        finally:
+            release.set()
+
+        assert messages == ["NAS 경로 접근 불가 (나중에 확인 필요): //slow-nas/renders"]
+
+
+class TestValidationLevel:
+    """WORKER_CONFIG_VALIDATION 검증 단계 테스트"""
+
+    def test_quick_skips_path_checks(self, tmp_path):
+        """QUICK은 경로 존재 확인 생략"""
+        config = WorkerConfig(
+            supabase_url="https://test.supabase.co",
+            supabase_service_key="key",
+            aep_template_dir=str(tmp_path / "missing_templates"),
+            nas_output_path="//missing-nas/renders",
+        )
+
+        assert config.validate(level=ValidationLevel.QUICK) == []
+
+    def test_quick_still_checks_required(self):
+        """QUICK도 필수값 누락은 오류"""
+        with pytest.raises(ConfigurationError):
+            WorkerConfig().validate(level=ValidationLevel.QUICK)
+
+    def test_none_checks_only_required(self):
+        """NONE은 필수값만 검증 (형식/범위 검증 생략)"""
+        config = WorkerConfig(
+            supabase_url="not-a-url",
+            supabase_service_key="key",
+            max_retries=-1,
+        )
+        assert config.validate(level=ValidationLevel.NONE) == []
+
+        with pytest.raises(ConfigurationError):
+            WorkerConfig().validate(level=ValidationLevel.NONE)
+
+    @pytest.mark.parametrize(
+        ("value", "raises"),
+        [("none", False), ("QUICK", True), ("bogus", True), ("", True)],
+    )
+    def test_from_env_validated_reads_level(self, value: str, raises: bool):
+        """환경변수로 검증 단계 선택 (알 수 없는 값은 full)"""
+        env = {
+            "WORKER_CONFIG_VALIDATION": value,
+            "SUPABASE_URL": "not-a-url",
+            "SUPABASE_SERVICE_KEY": "key",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            if raises:
+                with pytest.raises(ConfigurationError):
+                    WorkerConfig.from_env_validated()
+            else:
+                assert WorkerConfig.from_env_validated().supabase_url == "not-a-url"
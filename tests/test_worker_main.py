@@ -0,0 +1,120 @@
+"""
+Worker 폴링 대기 테스트
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from worker.config import ConfigurationError, WorkerConfig
+from worker.main import Worker, run
+
+
+@pytest.fixture
+def worker() -> Worker:
+    """외부 의존성을 Mock으로 대체한 Worker"""
+    with (
+        patch("worker.main.SupabaseQueueClient"),
+        patch("worker.main.JobProcessor"),
+        patch("worker.main.HealthServer"),
+    ):
+        return Worker(WorkerConfig())
+
+
+class TestWaitForNextPoll:
+    """_wait_for_next_poll 테스트"""
+
+    async def test_sleeps_without_realtime(self, worker: Worker):
+        """Realtime 미사용 시 폴링 주기만큼 sleep"""
+        with patch("worker.main.asyncio.sleep") as sleep:
+            await worker._wait_for_next_poll(30)
+
+        sleep.assert_awaited_once_with(30)
+
+    async def test_new_job_notification_wakes_immediately(self, worker: Worker):
+        """Realtime 알림 수신 시 대기 중단 후 이벤트 초기화"""
+        worker.realtime_active = True
+        loop = asyncio.get_running_loop()
+        loop.call_soon(worker._new_job.set)
+
+        started = loop.time()
+        await worker._wait_for_next_poll(60)
+
+        assert loop.time() - started < 1
+        assert not worker._new_job.is_set()
+
+    async def test_times_out_without_notification(self, worker: Worker):
+        """알림이 없으면 폴링 주기 후 반환 (안전망)"""
+        worker.realtime_active = True
+
+        await worker._wait_for_next_poll(0.01)
+
+        assert not worker._new_job.is_set()
+
+
+class TestShutdown:
+    """shutdown 테스트"""
+
+    async def test_release_after_processing_stops_before_close(self, worker: Worker):
+        """처리 태스크 취소 → 작업 릴리즈 → 세션 종료 순서"""
+        order = []
+        processing = asyncio.Event()
+
+        async def _process(job):
+            processing.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                order.append("cancelled")
+                raise
+
+        async def _release(job_id):
+            order.append(f"release {job_id}")
+
+        async def _close():
+            order.append("close")
+
+        worker.running = True
+        worker.processor.process = AsyncMock(side_effect=_process)
+        worker.supabase.claim_pending_job = AsyncMock(return_value={"id": "job-1"})
+        worker.supabase.release_job = AsyncMock(side_effect=_release)
+        worker.supabase.close = AsyncMock(side_effect=_close)
+        worker.processor.nexrender.close = AsyncMock(side_effect=_close)
+        worker.health_server.stop = AsyncMock()
+
+        loop_task = asyncio.create_task(worker._polling_loop())
+        await processing.wait()
+        await worker.shutdown()
+        await asyncio.wait_for(loop_task, timeout=1)
+
+        assert worker.running is False
+        assert order == ["cancelled", "release job-1", "close", "close"]
+        assert worker.current_job_id is None
+        worker.health_server.stop.assert_awaited_once()
+
+    async def test_failure_does_not_skip_other_steps(self, worker: Worker):
+        """한 단계가 실패해도 나머지 종료 처리는 진행"""
+        worker.supabase.close = AsyncMock()
+        worker.processor.nexrender.close = AsyncMock(side_effect=RuntimeError("boom"))
+        worker.health_server.stop = AsyncMock()
+
+        await worker.shutdown()
+
+        worker.health_server.stop.assert_awaited_once()
+
+
+class TestRun:
+    """run 엔트리포인트 테스트"""
+
+    @pytest.mark.parametrize("level", ["quick", "none"])
+    def test_missing_credentials_stop_before_worker_start(self, level: str):
+        """Supabase 설정 누락 시 검증 단계와 무관하게 워커를 생성하지 않음"""
+        with (
+            patch.dict("os.environ", {"WORKER_CONFIG_VALIDATION": level}, clear=True),
+            patch("worker.main.Worker") as worker_cls,
+        ):
+            with pytest.raises(ConfigurationError):
+                run()
+
+        worker_cls.assert_not_called()
@@ -6,7 +6,10 @@
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
 
 from lib.path_utils import PathMapping
 
@@ -19,7 +22,95 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass
+class ValidationLevel(str, Enum):
+    """설정 검증 단계 (WORKER_CONFIG_VALIDATION 환경변수)"""
+
+    FULL = "full"  # 전체 검증 (경로 존재 확인 포함)
+    QUICK = "quick"  # 필수값/형식/범위만 (파일 시스템 접근 없음)
+    NONE = "none"  # 필수값만 검증
+
+
+# 기본 경로 매핑 (PathMapping은 불변이므로 인스턴스 간 공유)
+_DEFAULT_PATH_MAPPINGS = (
+    PathMapping("/app/templates", "C:/claude/automation_ae/templates"),
+    PathMapping("/app/output", "C:/claude/automation_ae/output"),
+)
+
+
+def _parse_path_mappings(value: str) -> list[PathMapping]:
+    """PATH_MAPPINGS 환경변수 파싱
+
+    Args:
+        value: "/app/templates:C:/templates,/app/output:D:/output" 형식 문자열
+
+    Returns:
+        PathMapping 리스트 (":"가 없는 항목은 무시, 빈 문자열이면 빈 리스트)
+    """
+    path_mappings = []
+    start, length = 0, len(value)
+
+    # 중간 문자열 리스트 없이 인덱스로 "," / 첫 ":" 위치 탐색
+    while start < length:
+        end = value.find(",", start)
+        if end == -1:
+            end = length
+
+        colon = value.find(":", start, end)
+        if colon != -1:
+            path_mappings.append(
+                PathMapping(value[start:colon].strip(), value[colon + 1 : end].strip())
+            )
+
+        start = end + 1
+
+    return path_mappings
+
+
+def _parse_validation_level(value: str) -> ValidationLevel:
+    """WORKER_CONFIG_VALIDATION 값 파싱 (빈 값/알 수 없는 값은 FULL)"""
+    if not value:
+        return ValidationLevel.FULL
+    try:
+        return ValidationLevel(value.strip().lower())
+    except ValueError:
+        logger.warning(f"[Config] 알 수 없는 WORKER_CONFIG_VALIDATION 값: {value}, full 사용")
+        return ValidationLevel.FULL
+
+
+# 경로 존재 확인 전체 대기 시간 (초, 응답 없는 NAS가 시작을 막지 않도록)
+_PATH_CHECK_TIMEOUT = 5.0
+
+
+def _check_paths_exist(checks: list[tuple[str, str]]) -> list[str]:
+    """여러 경로의 존재 여부를 동시에 확인
+
+    느린 NAS stat이 로컬 디스크 확인과 겹치도록 스레드로 병렬 실행하며,
+    제한 시간 내 응답하지 않은 경로는 존재하지 않는 것으로 처리합니다.
+
+    Args:
+        checks: (경로, 경로가 없을 때의 경고 메시지) 목록
+
+    Returns:
+        존재하지 않는 경로의 경고 메시지 목록 (입력 순서 유지)
+    """
+    if not checks:
+        return []
+
+    executor = ThreadPoolExecutor(max_workers=len(checks))
+    try:
+        futures = [executor.submit(Path(path).exists) for path, _ in checks]
+        wait(futures, timeout=_PATH_CHECK_TIMEOUT)
+        return [
+            message
+            for future, (_, message) in zip(futures, checks, strict=True)
+            if not (future.done() and future.exception() is None and future.result())
+        ]
+    finally:
+        # 멈춘 stat 스레드를 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass(slots=True)
 class WorkerConfig:
     """워커 설정"""
 
@@ -48,57 +139,43 @@ class WorkerConfig:
     nas_output_path: str = "//NAS/renders"
 
     # 경로 매핑
-    path_mappings: list[PathMapping] = field(
-        default_factory=lambda: [
-            PathMapping("/app/templates", "C:/claude/automation_ae/templates"),
-            PathMapping("/app/output", "C:/claude/automation_ae/output"),
-        ]
-    )
+    path_mappings: list[PathMapping] = field(default_factory=lambda: list(_DEFAULT_PATH_MAPPINGS))
 
     # 헬스 서버
     health_port: int = 8080
 
+    # Supabase Realtime 작업 알림 (migrations/006 필요, 폴링은 안전망으로 유지)
+    realtime_enabled: bool = False
+
     @classmethod
     def from_env(cls) -> "WorkerConfig":
         """환경변수에서 설정 로드"""
-        # 경로 매핑 파싱 (선택적)
-        path_mappings_str = os.getenv("PATH_MAPPINGS", "")
-        path_mappings = []
-        if path_mappings_str:
-            # 형식: "/app/templates:C:/templates,/app/output:D:/output"
-            for mapping_str in path_mappings_str.split(","):
-                if ":" in mapping_str:
-                    docker_path, windows_path = mapping_str.split(":", 1)
-                    path_mappings.append(
-                        PathMapping(docker_path.strip(), windows_path.strip())
-                    )
+        env = os.environ
+        path_mappings = _parse_path_mappings(env.get("PATH_MAPPINGS", ""))
 
         return cls(
-            supabase_url=os.getenv("SUPABASE_URL", ""),
-            supabase_service_key=os.getenv("SUPABASE_SERVICE_KEY", ""),
-            nexrender_url=os.getenv("NEXRENDER_URL", "http://localhost:3000"),
-            nexrender_secret=os.getenv("NEXRENDER_SECRET", ""),
-            aep_template_dir=os.getenv("AEP_TEMPLATE_DIR", "D:/templates"),
-            output_dir=os.getenv("OUTPUT_DIR", "D:/output"),
-            nas_output_path=os.getenv("NAS_OUTPUT_PATH", "//NAS/renders"),
-            render_timeout=int(os.getenv("RENDER_TIMEOUT", "1800")),
-            max_retries=int(os.getenv("MAX_RETRIES", "3")),
-            health_port=int(os.getenv("HEALTH_PORT", "8080")),
-            path_mappings=(
-                path_mappings
-                if path_mappings
-                else [
-                    PathMapping("/app/templates", "C:/claude/automation_ae/templates"),
-                    PathMapping("/app/output", "C:/claude/automation_ae/output"),
-                ]
-            ),
+            supabase_url=env.get("SUPABASE_URL", ""),
+            supabase_service_key=env.get("SUPABASE_SERVICE_KEY", ""),
+            nexrender_url=env.get("NEXRENDER_URL", "http://localhost:3000"),
+            nexrender_secret=env.get("NEXRENDER_SECRET", ""),
+            aep_template_dir=env.get("AEP_TEMPLATE_DIR", "D:/templates"),
+            output_dir=env.get("OUTPUT_DIR", "D:/output"),
+            nas_output_path=env.get("NAS_OUTPUT_PATH", "//NAS/renders"),
+            render_timeout=int(env.get("RENDER_TIMEOUT", "1800")),
+            max_retries=int(env.get("MAX_RETRIES", "3")),
+            health_port=int(env.get("HEALTH_PORT", "8080")),
+            realtime_enabled=env.get("REALTIME_ENABLED", "").lower() in ("1", "true", "yes"),
+            path_mappings=path_mappings or list(_DEFAULT_PATH_MAPPINGS),
         )
 
-    def validate(self, strict: bool = True) -> list[str]:
+    def validate(
+        self, strict: bool = True, level: ValidationLevel = ValidationLevel.FULL
+    ) -> list[str]:
         """설정값 검증
 
         Args:
             strict: True면 필수값 누락 시 예외 발생, False면 경고만
+            level: 검증 단계 (QUICK은 경로 확인 생략, NONE은 필수값만 검증)
 
         Returns:
             list[str]: 검증 경고/오류 메시지 목록
@@ -109,17 +186,48 @@ class WorkerConfig:
         errors = []
         warnings = []
 
-        # 필수 환경변수 검증
-        required_fields = [
-            ("supabase_url", "SUPABASE_URL"),
-            ("supabase_service_key", "SUPABASE_SERVICE_KEY"),
-        ]
+        # 필수 환경변수 검증 (모든 단계에서 수행)
+        required_fields = (
+            (self.supabase_url, "SUPABASE_URL"),
+            (self.supabase_service_key, "SUPABASE_SERVICE_KEY"),
+        )
 
-        for field_name, env_name in required_fields:
-            value = getattr(self, field_name, "")
+        for value, env_name in required_fields:
             if not value:
                 errors.append(f"필수 환경변수 누락: {env_name}")
 
+        # 형식/범위/경로 검증 (NONE 단계에서는 생략)
+        if level != ValidationLevel.NONE:
+            optional_errors, warnings = self._optional_checks(level)
+            errors.extend(optional_errors)
+
+        # 경고 로깅
+        for warning in warnings:
+            logger.warning(f"[Config] {warning}")
+
+        # 오류 처리
+        if errors:
+            for error in errors:
+                logger.error(f"[Config] {error}")
+            if strict:
+                raise ConfigurationError(
+                    f"설정 검증 실패: {len(errors)}개 오류\n" + "\n".join(errors)
+                )
+
+        return errors + warnings
+
+    def _optional_checks(self, level: ValidationLevel) -> tuple[list[str], list[str]]:
+        """필수값 외 형식/범위/경로 검증
+
+        Args:
+            level: 검증 단계 (FULL에서만 경로 존재 확인)
+
+        Returns:
+            tuple[list[str], list[str]]: (오류 목록, 경고 목록)
+        """
+        errors = []
+        warnings = []
+
         # URL 형식 검증
         if self.supabase_url and not self.supabase_url.startswith("http"):
             errors.append(f"잘못된 SUPABASE_URL 형식: {self.supabase_url}")
@@ -127,34 +235,15 @@ class WorkerConfig:
         if self.nexrender_url and not self.nexrender_url.startswith("http"):
             errors.append(f"잘못된 NEXRENDER_URL 형식: {self.nexrender_url}")
 
-        # 경로 검증 (경고만)
-        from pathlib import Path
-
-        if self.output_dir:
-            output_path = Path(self.output_dir)
-            if not output_path.exists():
-                warnings.append(f"출력 디렉토리 없음: {self.output_dir}")
-
-        if self.aep_template_dir:
-            template_path = Path(self.aep_template_dir)
-            if not template_path.exists():
-                warnings.append(f"템플릿 디렉토리 없음: {self.aep_template_dir}")
-
-        # NAS 경로 검증 (경고만, UNC 경로는 접근 불가할 수 있음)
-        if self.nas_output_path and self.nas_output_path.startswith("//"):
-            nas_path = Path(self.nas_output_path)
-            if not nas_path.exists():
-                warnings.append(
-                    f"NAS 경로 접근 불가 (나중에 확인 필요): {self.nas_output_path}"
-                )
+        # 경로 검증 (경고만, FULL 단계에서만 파일 시스템 접근)
+        if level == ValidationLevel.FULL:
+            warnings.extend(_check_paths_exist(self._path_checks()))
 
         # 숫자값 범위 검증
         if self.render_timeout < 60:
             warnings.append(f"렌더링 타임아웃이 너무 짧음: {self.render_timeout}초")
         if self.render_timeout > 7200:
-            warnings.append(
-                f"렌더링 타임아웃이 너무 김: {self.render_timeout}초 (2시간 초과)"
-            )
+            warnings.append(f"렌더링 타임아웃이 너무 김: {self.render_timeout}초 (2시간 초과)")
 
         if self.max_retries < 0:
             errors.append(f"잘못된 max_retries 값: {self.max_retries}")
@@ -165,27 +254,34 @@ class WorkerConfig:
         if self.poll_interval_default < 1:
             errors.append(f"폴링 간격이 너무 짧음: {self.poll_interval_default}초")
 
-        # 경고 로깅
-        for warning in warnings:
-            logger.warning(f"[Config] {warning}")
+        return errors, warnings
 
-        # 오류 처리
-        if errors:
-            for error in errors:
-                logger.error(f"[Config] {error}")
-            if strict:
-                raise ConfigurationError(
-                    f"설정 검증 실패: {len(errors)}개 오류\n" + "\n".join(errors)
+    def _path_checks(self) -> list[tuple[str, str]]:
+        """존재 확인할 경로와 경고 메시지 목록"""
+        checks = []
+        if self.output_dir:
+            checks.append((self.output_dir, f"출력 디렉토리 없음: {self.output_dir}"))
+        if self.aep_template_dir:
+            checks.append((self.aep_template_dir, f"템플릿 디렉토리 없음: {self.aep_template_dir}"))
+        # NAS 경로 검증 (UNC 경로는 접근 불가할 수 있음)
+        if self.nas_output_path and self.nas_output_path.startswith("//"):
+            checks.append(
+                (
+                    self.nas_output_path,
+                    f"NAS 경로 접근 불가 (나중에 확인 필요): {self.nas_output_path}",
                 )
-
-        return errors + warnings
+            )
+        return checks
 
     @classmethod
-    def from_env_validated(cls, strict: bool = True) -> "WorkerConfig":
+    def from_env_validated(
+        cls, strict: bool = True, level: ValidationLevel | None = None
+    ) -> "WorkerConfig":
         """환경변수에서 설정 로드 및 검증
 
         Args:
             strict: True면 필수값 누락 시 예외 발생
+            level: 검증 단계 (None이면 WORKER_CONFIG_VALIDATION 환경변수, 기본 full)
 
         Returns:
             검증된 WorkerConfig 인스턴스
@@ -194,5 +290,7 @@ class WorkerConfig:
             ConfigurationError: strict=True이고 필수값 누락 시
         """
         config = cls.from_env()
-        config.validate(strict=strict)
+        if level is None:
+            level = _parse_validation_level(os.environ.get("WORKER_CONFIG_VALIDATION", ""))
+        config.validate(strict=strict, level=level)
         return config
@@ -5,11 +5,13 @@
 """
 
 import logging
-from datetime import datetime, timezone
+import time
 from typing import TYPE_CHECKING
 
 from aiohttp import web
 
+from lib.json_utils import dumps
+
 if TYPE_CHECKING:
     from .main import Worker
 
@@ -22,6 +24,8 @@ class HealthServer:
     aiohttp를 사용하여 워커 상태를 노출하는 간단한 HTTP 서버입니다.
     """
 
+    __slots__ = ("worker", "app", "runner", "site", "started_ns", "_worker_id")
+
     def __init__(self, worker: "Worker"):
         """
         Args:
@@ -31,7 +35,9 @@ class HealthServer:
         self.app = web.Application()
         self.runner: web.AppRunner | None = None
         self.site: web.TCPSite | None = None
-        self.started_at = datetime.now(timezone.utc)
+        self.started_ns = time.monotonic_ns()
+        # worker_id는 워커 생성 시 고정되므로 문자열 변환 1회
+        self._worker_id = str(worker.worker_id)
 
         # 라우트 등록
         self.app.router.add_get("/health", self._health_handler)
@@ -49,17 +55,18 @@ class HealthServer:
                     "uptime_seconds": 1234
                 }
         """
-        uptime = (datetime.now(timezone.utc) - self.started_at).total_seconds()
+        uptime = (time.monotonic_ns() - self.started_ns) // 1_000_000_000
 
-        return web.json_response(
+        payload = dumps(
             {
                 "status": "ok",
-                "worker_id": str(self.worker.worker_id),
+                "worker_id": self._worker_id,
                 "running": self.worker.running,
                 "current_job_id": self.worker.current_job_id,
-                "uptime_seconds": int(uptime),
+                "uptime_seconds": uptime,
             }
         )
+        return web.Response(body=payload, content_type="application/json")
 
     async def start(self) -> None:
         """헬스 서버 시작
@@ -13,13 +13,15 @@
 
 import asyncio
 import logging
+import os
+import random
 import shutil
 import time
 from pathlib import Path
 from typing import Any
 
 from lib.client import NexrenderClient
-from lib.errors import ErrorCategory, ErrorClassifier
+from lib.errors import ErrorCategory, ErrorClassifier, NexrenderError
 from lib.job_builder import JobConfig, NexrenderJobBuilder
 from lib.path_utils import PathConverter
 from lib.types import RenderStatus
@@ -34,6 +36,46 @@ class JobProcessor:
     필드명은 기존 스키마(aep_project, aep_comp_name 등)를 사용합니다.
     """
 
+    __slots__ = ("config", "supabase", "nexrender", "path_converter", "_nas_dir_check")
+
+    # Nexrender state → (render_queue status, progress)
+    # "rendering"은 renderProgress에 따라 진행률이 달라지므로 폴링 중 계산
+    _STATUS_MAP = {
+        "queued": (RenderStatus.RENDERING.value, 25),
+        "started": (RenderStatus.RENDERING.value, 30),
+        "downloading": (RenderStatus.RENDERING.value, 35),
+        "encoding": (RenderStatus.ENCODING.value, 85),
+        "finished": (RenderStatus.UPLOADING.value, 95),
+    }
+
+    # Nexrender state별 폴링 간격 (초)
+    # 준비 단계는 빠르게 끝나므로 짧게, 렌더링 중에는 길게 조회
+    _POLL_INTERVALS = {
+        "queued": 1,
+        "started": 1,
+        "downloading": 1,
+        "rendering": 10,
+        "encoding": 2,
+    }
+    _DEFAULT_POLL_INTERVAL = 5
+    # 렌더링 완료 임박 (renderProgress %) 시 encoding 간격으로 조회하여 다음 단계 전환을 빨리 감지
+    _NEAR_COMPLETE_PROGRESS = 90
+    # 같은 state 내에서 Supabase에 반영할 최소 진행률 변화 (%)
+    _MIN_PROGRESS_DELTA = 2
+    # 상태 조회 연속 실패 시 지수 백오프 상한 (초)
+    _MAX_BACKOFF_INTERVAL = 60
+
+    # 출력 포맷 → 파일 확장자 (미등록 포맷은 mp4)
+    _OUTPUT_EXT_MAP = {
+        "mp4": "mp4",
+        "mov": "mov",
+        "mov_alpha": "mov",
+        "png_sequence": "png",
+    }
+
+    # NAS 디렉토리 확인 결과 유효 시간 (초)
+    _NAS_CHECK_TTL = 60
+
     def __init__(self, config, supabase_client):
         """
         Args:
@@ -47,6 +89,8 @@ class JobProcessor:
             secret=config.nexrender_secret,
         )
         self.path_converter = PathConverter()
+        # NAS 디렉토리 접근 가능 여부 캐시: (확인 시각 monotonic, 결과)
+        self._nas_dir_check: tuple[float, bool] | None = None
 
     async def process(self, job: dict[str, Any]) -> dict[str, Any]:
         """작업 처리 메인 로직
@@ -81,21 +125,22 @@ class JobProcessor:
 
         try:
             # 1. 상태 업데이트: preparing
-            await self.supabase.update_job_status(
-                job_id, RenderStatus.PREPARING.value, progress=5
-            )
+            await self.supabase.update_job_status(job_id, RenderStatus.PREPARING.value, progress=5)
 
             # 2. Nexrender Job JSON 생성
             # 기존 스키마 필드명 사용: aep_project, aep_comp_name
+            # (후처리에서도 재사용하도록 필요한 필드를 한 번만 추출)
             aep_project = job.get("aep_project", "")
             aep_comp_name = job.get("aep_comp_name", "")
             output_format = job.get("output_format", "mp4")
             output_path = job.get("output_path", "")
+            gfx_data = job["gfx_data"]
 
             # output_path에서 디렉토리와 파일명 분리
             if output_path:
-                output_dir = str(Path(output_path).parent)
-                output_filename = Path(output_path).stem
+                output_dir, filename = os.path.split(output_path)
+                output_dir = output_dir or "."  # Path.parent와 동일하게 현재 디렉토리
+                output_filename = os.path.splitext(filename)[0]
             else:
                 output_dir = self.config.output_dir
                 output_filename = job_id
@@ -111,7 +156,7 @@ class JobProcessor:
             )
 
             nexrender_job_data = builder.build_from_gfx_data(
-                gfx_data=job["gfx_data"],
+                gfx_data=gfx_data,
                 job_id=job_id,
             )
 
@@ -121,21 +166,17 @@ class JobProcessor:
             nexrender_response = await self.nexrender.submit_job(nexrender_job_data)
             nexrender_job_uid = nexrender_response.get("uid")
 
-            logger.info(
-                f"[Processor] Nexrender 작업 제출 완료: UID={nexrender_job_uid}"
-            )
+            logger.info(f"[Processor] Nexrender 작업 제출 완료: UID={nexrender_job_uid}")
 
             # nexrender_job_id를 metadata에 저장
             await self.supabase.set_nexrender_job_id(job_id, nexrender_job_uid)
-            await self.supabase.update_job_status(
-                job_id, RenderStatus.RENDERING.value, progress=20
-            )
+            await self.supabase.update_job_status(job_id, RenderStatus.RENDERING.value, progress=20)
 
             # 4. 진행률 폴링
             await self._poll_nexrender_progress(job_id, nexrender_job_uid)
 
             # 5. 후처리 (파일 검증, NAS 복사)
-            final_output_path = await self._post_process(job, nexrender_job_uid)
+            final_output_path = await self._post_process(job_id, output_path, output_format)
 
             # 6. 완료
             render_duration_ms = int((time.time() - start_time) * 1000)
@@ -145,9 +186,7 @@ class JobProcessor:
                 render_duration_ms=render_duration_ms,
             )
 
-            logger.info(
-                f"[Processor] 작업 완료: Job {job_id}, output={final_output_path}"
-            )
+            logger.info(f"[Processor] 작업 완료: Job {job_id}, output={final_output_path}")
 
             return {
                 "status": "success",
@@ -161,9 +200,7 @@ class JobProcessor:
             await self._handle_error(job_id, e)
             raise
 
-    async def _poll_nexrender_progress(
-        self, job_id: str, nexrender_job_uid: str
-    ) -> None:
+    async def _poll_nexrender_progress(self, job_id: str, nexrender_job_uid: str) -> None:
         """Nexrender 작업 상태 폴링
 
         Args:
@@ -175,77 +212,83 @@ class JobProcessor:
             NexrenderError: 렌더링 실패
         """
         max_timeout = self.config.render_timeout  # 30분
-        poll_interval = 5  # 5초
         elapsed = 0
+        state = ""
+        render_progress = 0
+        failures = 0  # 연속 상태 조회 실패 횟수
+        # 마지막으로 반영한 (state, progress) - state가 같고 진행률 변화가 작으면 업데이트 생략
+        last_emitted: tuple[str, int] | None = None
 
-        logger.info(
-            f"[Processor] 진행률 폴링 시작: Job {job_id}, UID={nexrender_job_uid}"
-        )
+        logger.info(f"[Processor] 진행률 폴링 시작: Job {job_id}, UID={nexrender_job_uid}")
 
         while elapsed < max_timeout:
             try:
                 nexrender_status = await self.nexrender.get_job(nexrender_job_uid)
+                failures = 0
                 state = nexrender_status.get("state", "")
                 render_progress = nexrender_status.get("renderProgress", 0)
                 error = nexrender_status.get("error")
 
                 logger.debug(
-                    f"[Processor] Job {job_id}: Nexrender state={state}, "
-                    f"progress={render_progress}"
+                    f"[Processor] Job {job_id}: Nexrender state={state}, progress={render_progress}"
                 )
 
-                # 상태 매핑 (Nexrender state -> render_queue status, progress)
-                status_map = {
-                    "queued": (RenderStatus.RENDERING.value, 25),
-                    "started": (RenderStatus.RENDERING.value, 30),
-                    "downloading": (RenderStatus.RENDERING.value, 35),
-                    "rendering": (
-                        RenderStatus.RENDERING.value,
-                        40 + int(render_progress * 0.4),
-                    ),
-                    "encoding": (RenderStatus.ENCODING.value, 85),
-                    "finished": (RenderStatus.UPLOADING.value, 95),
-                }
-
                 if state == "error":
-                    from lib.errors import NexrenderError
-
                     raise NexrenderError(f"렌더링 실패: {error}")
 
-                if state in status_map:
-                    status, progress = status_map[state]
+                # 상태 매핑 (Nexrender state -> render_queue status, progress)
+                if state == "rendering":
+                    mapped = (RenderStatus.RENDERING.value, 40 + int(render_progress * 0.4))
+                else:
+                    mapped = self._STATUS_MAP.get(state)
+
+                state_changed = last_emitted is None or last_emitted[0] != state
+                if mapped is not None and (
+                    state_changed or abs(mapped[1] - last_emitted[1]) >= self._MIN_PROGRESS_DELTA
+                ):
+                    status, progress = mapped
+                    # 진행률과 상태를 한 번의 UPDATE로 반영
+                    # nexrender_state는 바뀔 때만 전달 (metadata 조회/쓰기 생략)
                     await self.supabase.update_progress(
                         job_id,
                         progress=progress,
-                        nexrender_state=state,
+                        nexrender_state=state if state_changed else None,
+                        status=status,
                     )
-                    # 상태도 업데이트
-                    await self.supabase.update_job_status(job_id, status)
+                    last_emitted = (state, progress)
 
                 if state == "finished":
                     logger.info(f"[Processor] 렌더링 완료: Job {job_id}")
                     return
 
+            except NexrenderError:
+                # 렌더링 실패이므로 다시 raise
+                raise
             except Exception as e:
-                # NexrenderError는 렌더링 실패이므로 다시 raise
-                from lib.errors import NexrenderError
-
-                if isinstance(e, NexrenderError):
-                    raise
                 logger.warning(f"[Processor] 상태 조회 실패: Job {job_id}, Error: {e}")
-                # 네트워크 등 일시적 오류는 무시하고 계속 폴링
-
+                # 네트워크 등 일시적 오류는 무시하고 백오프 후 계속 폴링
+                failures += 1
+
+            # 상태별 폴링 간격 (조회 실패 시 state는 직전 값 유지)
+            poll_interval = self._POLL_INTERVALS.get(state, self._DEFAULT_POLL_INTERVAL)
+            if state == "rendering" and render_progress >= self._NEAR_COMPLETE_PROGRESS:
+                poll_interval = self._POLL_INTERVALS["encoding"]
+            if failures:
+                # 지수 백오프 + jitter (여러 워커의 재시도 집중 방지)
+                backoff = min(poll_interval * 2**failures, self._MAX_BACKOFF_INTERVAL)
+                poll_interval = backoff * (0.5 + random.random())
             await asyncio.sleep(poll_interval)
             elapsed += poll_interval
 
         raise TimeoutError(f"렌더링 타임아웃 (Job {job_id}, {max_timeout}초 초과)")
 
-    async def _post_process(self, job: dict[str, Any], nexrender_job_uid: str) -> str:
+    async def _post_process(self, job_id: str, output_path: str, output_format: str) -> str:
         """후처리: 파일 검증, NAS 복사
 
         Args:
-            job: render_queue 레코드
-            nexrender_job_uid: Nexrender Job UID
+            job_id: render_queue 작업 ID
+            output_path: render_queue.output_path (기존 스키마, 없으면 빈 문자열)
+            output_format: 출력 포맷 (mp4, mov, mov_alpha 등)
 
         Returns:
             str: 최종 출력 파일 경로 (NAS 복사 시 NAS 경로)
@@ -253,34 +296,23 @@ class JobProcessor:
         Raises:
             FileNotFoundError: 출력 파일 없음 또는 크기가 0
         """
-        job_id = job["id"]
-
-        # 기존 스키마: output_path 사용
-        output_path = job.get("output_path")
-
         if not output_path:
             # output_path가 없으면 기본 경로 구성
-            output_ext_map = {
-                "mp4": "mp4",
-                "mov": "mov",
-                "mov_alpha": "mov",
-                "png_sequence": "png",
-            }
-            output_ext = output_ext_map.get(job.get("output_format", "mp4"), "mp4")
+            output_ext = self._OUTPUT_EXT_MAP.get(output_format, "mp4")
             output_path = f"{self.config.output_dir}/{job_id}.{output_ext}"
 
         # Windows 경로로 변환 (Docker 환경)
         output_path = self.path_converter.to_windows_path(output_path)
         output_file = Path(output_path)
 
-        # 1. 파일 검증: 존재 여부
-        await self._verify_output_file(output_file, job_id)
+        # 1. 파일 검증: 존재 여부 (stat 결과를 크기 검증에 재사용)
+        output_stat = await self._verify_output_file(output_file, job_id)
 
         # 2. 파일 검증: 크기 확인
-        file_size = await self._verify_file_size(output_file, job_id)
+        file_size = await self._verify_file_size(output_stat, job_id)
 
         # 3. 파일 검증: 포맷 확인 (확장자 기반)
-        await self._verify_file_format(output_file, job.get("output_format", "mp4"))
+        await self._verify_file_format(output_file, output_format)
 
         logger.info(
             f"[Processor] 파일 검증 완료: Job {job_id}, "
@@ -299,7 +331,7 @@ class JobProcessor:
 
     async def _verify_output_file(
         self, output_file: Path, job_id: str, max_retries: int = 3
-    ) -> None:
+    ) -> os.stat_result:
         """출력 파일 존재 확인 (재시도 포함)
 
         Nexrender action-copy 완료 후에도 파일 시스템 동기화 지연이 있을 수 있어
@@ -310,12 +342,19 @@ class JobProcessor:
             job_id: 작업 ID
             max_retries: 최대 재시도 횟수
 
+        Returns:
+            os.stat_result: 출력 파일 stat 결과 (후속 검증에서 재사용)
+
         Raises:
             FileNotFoundError: 파일이 존재하지 않음
         """
         for attempt in range(max_retries):
-            if output_file.exists():
-                return
+            try:
+                # 느린 NAS/SMB stat이 이벤트 루프를 막지 않도록 스레드에서 실행
+                return await asyncio.to_thread(os.stat, output_file)
+            except OSError:
+                # 기존 Path.exists()처럼 접근 불가(NotADirectory/Permission 등)도 파일 없음으로 처리
+                pass
 
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 2  # 2초, 4초, 6초
@@ -328,12 +367,12 @@ class JobProcessor:
         raise FileNotFoundError(f"출력 파일 없음: Job {job_id}, path={output_file}")
 
     async def _verify_file_size(
-        self, output_file: Path, job_id: str, min_size: int = 1024
+        self, output_stat: os.stat_result, job_id: str, min_size: int = 1024
     ) -> int:
         """출력 파일 크기 검증
 
         Args:
-            output_file: 출력 파일 경로
+            output_stat: 출력 파일 stat 결과 (_verify_output_file 반환값)
             job_id: 작업 ID
             min_size: 최소 파일 크기 (bytes), 기본 1KB
 
@@ -343,7 +382,7 @@ class JobProcessor:
         Raises:
             ValueError: 파일 크기가 너무 작음 (렌더링 실패 의심)
         """
-        file_size = output_file.stat().st_size
+        file_size = output_stat.st_size
 
         if file_size < min_size:
             raise ValueError(
@@ -353,9 +392,7 @@ class JobProcessor:
 
         return file_size
 
-    async def _verify_file_format(
-        self, output_file: Path, expected_format: str
-    ) -> None:
+    async def _verify_file_format(self, output_file: Path, expected_format: str) -> None:
         """출력 파일 포맷 검증 (확장자 기반)
 
         Args:
@@ -365,19 +402,28 @@ class JobProcessor:
         Raises:
             ValueError: 확장자 불일치
         """
-        expected_ext_map = {
-            "mp4": ".mp4",
-            "mov": ".mov",
-            "mov_alpha": ".mov",
-            "png_sequence": ".png",
-        }
-        expected_ext = expected_ext_map.get(expected_format.lower(), ".mp4")
-        actual_ext = output_file.suffix.lower()
+        expected_ext = "." + self._OUTPUT_EXT_MAP.get(expected_format.lower(), "mp4")
+        actual_ext = os.path.splitext(output_file)[1].lower()
 
         if actual_ext != expected_ext:
-            raise ValueError(
-                f"출력 파일 포맷 불일치: 예상={expected_ext}, 실제={actual_ext}"
-            )
+            raise ValueError(f"출력 파일 포맷 불일치: 예상={expected_ext}, 실제={actual_ext}")
+
+    @staticmethod
+    def _copy_file(source_file: str, dest_file: str) -> int:
+        """파일 복사 후 복사본 크기 반환 (blocking, 스레드에서 호출)
+
+        shutil.copy2는 Linux에서 os.sendfile 기반 커널 내 복사를 사용합니다.
+
+        Args:
+            source_file: 원본 파일 경로
+            dest_file: 대상 파일 경로
+
+        Returns:
+            int: 복사된 파일 크기 (바이트)
+        """
+        shutil.copy2(source_file, dest_file)
+        # copy2 성공 시 파일이 존재하므로 stat 1회
+        return os.stat(dest_file).st_size
 
     async def _copy_to_nas(
         self, source_file: Path, job_id: str, max_retries: int = 2
@@ -400,37 +446,30 @@ class JobProcessor:
             return None
 
         # NAS 경로 구성: //NAS/renders/{job_id}.{ext}
-        nas_path = Path(nas_base) / source_file.name
-        nas_path_str = str(nas_path)
+        nas_path_str = os.path.join(nas_base, os.path.basename(source_file))
 
         for attempt in range(max_retries):
             try:
                 # NAS 디렉토리 접근 가능 여부 확인
-                nas_dir = Path(nas_base)
-                if not nas_dir.exists():
+                if not await self._is_nas_dir_available(nas_base):
                     logger.warning(f"[Processor] NAS 디렉토리 접근 불가: {nas_base}")
                     return None
 
-                # 비동기 복사 (blocking I/O를 executor에서 실행)
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None, shutil.copy2, str(source_file), nas_path_str
-                )
+                # 복사와 검증 stat 모두 blocking NAS I/O이므로 같은 스레드에서 실행
+                copied_size = await asyncio.to_thread(self._copy_file, source_file, nas_path_str)
 
-                # 복사 검증
-                if nas_path.exists() and nas_path.stat().st_size > 0:
-                    logger.info(
-                        f"[Processor] NAS 복사 성공: Job {job_id}, "
-                        f"nas={nas_path_str}"
-                    )
+                if copied_size > 0:
+                    logger.info(f"[Processor] NAS 복사 성공: Job {job_id}, nas={nas_path_str}")
                     return nas_path_str
 
             except PermissionError as e:
+                self._nas_dir_check = None  # 다음 시도에서 NAS 재확인
                 logger.warning(
                     f"[Processor] NAS 복사 권한 오류: Job {job_id}, "
                     f"attempt {attempt + 1}/{max_retries}, error={e}"
                 )
             except OSError as e:
+                self._nas_dir_check = None  # 다음 시도에서 NAS 재확인
                 logger.warning(
                     f"[Processor] NAS 복사 실패: Job {job_id}, "
                     f"attempt {attempt + 1}/{max_retries}, error={e}"
@@ -439,12 +478,30 @@ class JobProcessor:
             if attempt < max_retries - 1:
                 await asyncio.sleep(2)
 
-        logger.error(
-            f"[Processor] NAS 복사 최종 실패: Job {job_id}, "
-            f"로컬 파일 유지: {source_file}"
-        )
+        logger.error(f"[Processor] NAS 복사 최종 실패: Job {job_id}, 로컬 파일 유지: {source_file}")
         return None
 
+    async def _is_nas_dir_available(self, nas_base: str) -> bool:
+        """NAS 디렉토리 접근 가능 여부 (_NAS_CHECK_TTL 동안 결과 캐시)
+
+        SMB 경로 stat은 수백 ms가 걸릴 수 있어 연속 작업에서 재사용합니다.
+
+        Args:
+            nas_base: NAS 출력 디렉토리 경로
+
+        Returns:
+            bool: 디렉토리 접근 가능 여부
+        """
+        now = time.monotonic()
+        if self._nas_dir_check is not None:
+            checked_at, available = self._nas_dir_check
+            if now - checked_at < self._NAS_CHECK_TTL:
+                return available
+
+        available = await asyncio.to_thread(os.path.isdir, nas_base)
+        self._nas_dir_check = (now, available)
+        return available
+
     async def _handle_error(self, job_id: str, error: Exception) -> None:
         """에러 처리
 
@@ -456,7 +513,6 @@ class JobProcessor:
             error: 발생한 예외
         """
         category = ErrorClassifier.classify(error)
-        message = ErrorClassifier.format_message(error, include_traceback=True)
 
         logger.error(f"[Processor] 에러 분류: Job {job_id}, Category={category.value}")
 
@@ -466,6 +522,9 @@ class JobProcessor:
             logger.warning(f"[Processor] 작업 조회 실패: Job {job_id}")
             return
 
+        # 저장할 작업이 있을 때만 traceback 포함 메시지 조립
+        message = ErrorClassifier.format_message(error, include_traceback=True)
+
         # error_details에서 retry_count 읽기 (기존 스키마 호환)
         error_details = job.get("error_details", {}) or {}
         retry_count = error_details.get("retry_count", 0)
@@ -475,8 +534,7 @@ class JobProcessor:
 
         if should_retry:
             logger.info(
-                f"[Processor] 재시도 예정: Job {job_id}, "
-                f"retry #{retry_count + 1}/{max_retries}"
+                f"[Processor] 재시도 예정: Job {job_id}, retry #{retry_count + 1}/{max_retries}"
             )
             await self.supabase.mark_failed(
                 job_id,
@@ -486,8 +544,7 @@ class JobProcessor:
             )
         else:
             logger.error(
-                f"[Processor] 작업 실패 (재시도 불가): Job {job_id}, "
-                f"Category={category.value}"
+                f"[Processor] 작업 실패 (재시도 불가): Job {job_id}, Category={category.value}"
             )
             await self.supabase.mark_failed(
                 job_id,
@@ -33,6 +33,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 호스트명은 프로세스 수명 동안 고정 (워커 생성마다 조회하지 않음)
+_HOSTNAME = socket.gethostname()
+
+# Realtime 알림 사용 시 idle 폴링 간격 (알림 누락 대비 안전망, 초)
+_REALTIME_FALLBACK_INTERVAL = 60
+
 
 class Worker:
     """AE-Nexrender 워커 (기존 스키마 호환)
@@ -49,10 +55,14 @@ class Worker:
         self.config = config
         # worker_id는 TEXT 타입 (기존 스키마 호환)
         # 형식: hostname-uuid (식별 용이)
-        hostname = socket.gethostname()
-        self.worker_id = f"{hostname}-{uuid.uuid4().hex[:8]}"
+        self.worker_id = f"{_HOSTNAME}-{uuid.uuid4().hex[:8]}"
         self.running = False
         self.current_job_id: str | None = None
+        # 현재 작업 처리 태스크 (종료 시 취소 대상)
+        self._process_task: asyncio.Task[None] | None = None
+        # Realtime 새 작업 알림 (구독 성공 시에만 사용)
+        self.realtime_active = False
+        self._new_job = asyncio.Event()
 
         self.supabase = SupabaseQueueClient(config)
         self.processor = JobProcessor(config, self.supabase)
@@ -76,14 +86,17 @@ class Worker:
         if sys.platform != "win32":
             loop = asyncio.get_event_loop()
             for sig in (signal.SIGINT, signal.SIGTERM):
-                loop.add_signal_handler(
-                    sig, lambda: asyncio.create_task(self.shutdown())
-                )
+                loop.add_signal_handler(sig, lambda: asyncio.create_task(self.shutdown()))
         else:
             # Windows: signal.signal() 사용 (SIGTERM은 Windows에서 지원 안 함)
-            signal.signal(
-                signal.SIGINT, lambda s, f: asyncio.create_task(self.shutdown())
-            )
+            signal.signal(signal.SIGINT, lambda s, f: asyncio.create_task(self.shutdown()))
+
+        # Nexrender 연결 재사용 (폴링 요청마다 연결 생성 방지)
+        self.processor.nexrender.open_session()
+
+        # 새 작업 알림 구독 (실패 시 폴링만 사용)
+        if self.config.realtime_enabled:
+            self.realtime_active = await self.supabase.subscribe_new_jobs(self._new_job.set)
 
         # 헬스 서버 시작
         await self.health_server.start()
@@ -97,15 +110,19 @@ class Worker:
         - 빈 폴링 10회 초과 시 idle 모드 (30초 주기)
         - 작업 있으면 busy 모드 (5초 주기)
         - 에러 발생 시 60초 주기
+        - Realtime 알림 수신 시 대기 중이어도 즉시 폴링 (idle 주기는 최소 60초)
         """
         empty_poll_count = 0
         poll_interval = self.config.poll_interval_default
+        idle_interval = self.config.poll_interval_idle
+        if self.realtime_active:
+            idle_interval = max(idle_interval, _REALTIME_FALLBACK_INTERVAL)
 
         logger.info("[Worker] 폴링 루프 시작")
 
         while self.running:
             try:
-                # 1. 대기 작업 조회 및 할당 (claim_render_job RPC)
+                # 1. 대기 작업 조회 및 할당 (claim_pending_render_job RPC)
                 job = await self.supabase.claim_pending_job(self.worker_id)
 
                 if job:
@@ -121,15 +138,20 @@ class Worker:
 
                     self.current_job_id = job_id
 
-                    # 작업 처리
+                    # 작업 처리 (shutdown에서 취소할 수 있도록 태스크로 실행)
+                    self._process_task = asyncio.create_task(self.processor.process(job))
                     try:
-                        await self.processor.process(job)
+                        await self._process_task
+                    except asyncio.CancelledError:
+                        # 폴링 루프 자체가 취소된 경우는 전파
+                        if asyncio.current_task().cancelling():
+                            raise
+                        logger.info(f"[Worker] 종료로 작업 처리 중단: Job {job_id}")
                     except Exception as e:
-                        logger.error(
-                            f"[Worker] 작업 처리 중 에러: Job {job_id}, Error: {e}"
-                        )
+                        logger.error(f"[Worker] 작업 처리 중 에러: Job {job_id}, Error: {e}")
                     finally:
                         self.current_job_id = None
+                        self._process_task = None
 
                 else:
                     # 작업 없음 → empty_poll_count 증가
@@ -137,42 +159,86 @@ class Worker:
 
                     if empty_poll_count > self.config.empty_poll_threshold:
                         # idle 모드로 전환
-                        if poll_interval != self.config.poll_interval_idle:
-                            poll_interval = self.config.poll_interval_idle
-                            logger.info(
-                                f"[Worker] Idle 모드 전환 (빈 폴링 {empty_poll_count}회)"
-                            )
+                        if poll_interval != idle_interval:
+                            poll_interval = idle_interval
+                            logger.info(f"[Worker] Idle 모드 전환 (빈 폴링 {empty_poll_count}회)")
 
             except Exception as e:
                 logger.error(f"[Worker] 폴링 루프 에러: {e}", exc_info=True)
                 poll_interval = self.config.poll_interval_error  # 에러 모드 60초
 
-            # 폴링 주기만큼 대기
-            await asyncio.sleep(poll_interval)
+            # 폴링 주기만큼 대기 (새 작업 알림 시 즉시 깨어남)
+            await self._wait_for_next_poll(poll_interval)
 
         logger.info("[Worker] 폴링 루프 종료")
 
+    async def _wait_for_next_poll(self, poll_interval: float) -> None:
+        """다음 폴링까지 대기
+
+        Args:
+            poll_interval: 최대 대기 시간 (초)
+        """
+        if not self.realtime_active:
+            await asyncio.sleep(poll_interval)
+            return
+
+        try:
+            await asyncio.wait_for(self._new_job.wait(), timeout=poll_interval)
+        except TimeoutError:
+            pass
+        self._new_job.clear()
+
     async def shutdown(self) -> None:
         """우아한 종료
 
-        현재 작업이 있으면 상태를 복원하고, 헬스 서버를 종료합니다.
+        진행 중인 작업 처리를 중단하고 상태를 복원한 뒤, 연결과 헬스 서버를 종료합니다.
         """
         logger.info("[Worker] 종료 신호 수신, 우아한 종료 시작...")
         self.running = False
 
-        # 현재 작업이 있으면 락 해제 (다른 워커가 재처리할 수 있도록)
-        if self.current_job_id:
-            logger.info(f"[Worker] 현재 작업 릴리즈: Job {self.current_job_id}")
-            try:
-                await self.supabase.release_job(self.current_job_id)
-            except Exception as e:
-                logger.error(f"[Worker] 작업 릴리즈 실패: {e}")
-
-        # 헬스 서버 종료
-        await self.health_server.stop()
+        # 처리가 끝난 뒤에 릴리즈해야 이 워커가 pending 작업에 다시 쓰지 않음
+        job_id = self.current_job_id
+        await self._cancel_processing()
+        await self._release_job(job_id)
+
+        # 처리 중단 후에만 세션 종료 (헬스 서버 종료와는 독립적이므로 동시에 진행)
+        results = await asyncio.gather(
+            self.processor.nexrender.close(),
+            self.supabase.close(),
+            self.health_server.stop(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"[Worker] 종료 처리 실패: {result}")
 
         logger.info("[Worker] 종료 완료")
 
+    async def _cancel_processing(self) -> None:
+        """진행 중인 작업 처리 태스크를 취소하고 종료될 때까지 대기"""
+        task = self._process_task
+        if task is None or task.done():
+            return
+
+        task.cancel()
+        # 취소/에러 결과는 폴링 루프에서 처리하므로 완료만 대기
+        await asyncio.wait([task])
+
+    async def _release_job(self, job_id: str | None) -> None:
+        """작업이 있으면 락 해제 (다른 워커가 재처리할 수 있도록)
+
+        Args:
+            job_id: 릴리즈할 작업 ID (None이면 생략)
+        """
+        if not job_id:
+            return
+
+        logger.info(f"[Worker] 현재 작업 릴리즈: Job {job_id}")
+        try:
+            await self.supabase.release_job(job_id)
+        except Exception as e:
+            logger.error(f"[Worker] 작업 릴리즈 실패: {e}")
+
 
 # ============================================================================
 # 엔트리포인트
@@ -188,13 +254,8 @@ def run() -> None:
     logger.info("AE-Nexrender Worker v2.0")
     logger.info("=" * 60)
 
-    # 설정 로드
-    config = WorkerConfig.from_env()
-
-    # 설정 검증
-    if not config.supabase_url or not config.supabase_service_key:
-        logger.error("환경변수 누락: SUPABASE_URL, SUPABASE_SERVICE_KEY 필수")
-        raise ValueError("Supabase 설정 누락")
+    # 설정 로드 및 검증 (검증 단계는 WORKER_CONFIG_VALIDATION 환경변수)
+    config = WorkerConfig.from_env_validated()
 
     logger.info(f"Supabase URL: {config.supabase_url}")
     logger.info(f"Nexrender URL: {config.nexrender_url}")
@@ -2,35 +2,151 @@
 Supabase render_queue CRUD 클라이언트
 
 기존 Supabase 스키마 (orch_render_status, orch_render_type)와 호환.
-claim_render_job RPC 없이 직접 쿼리로 작업 할당.
+작업 할당은 claim_pending_render_job RPC (migrations/004) 1회 호출로 처리.
 """
 
+import asyncio
+import logging
 import socket
+import time
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
-from lib.types import RenderStatus
+from postgrest import ReturnMethod
 from supabase import Client, create_client
 
+from lib.types import RenderStatus
+
 from .config import WorkerConfig
 
+try:
+    from realtime import AsyncRealtimeClient  # supabase Realtime (선택적)
+except ImportError:
+    AsyncRealtimeClient = None
+
+logger = logging.getLogger(__name__)
+
+# 호스트명은 프로세스 수명 동안 고정 (클라이언트 생성마다 조회하지 않음)
+_HOSTNAME = socket.gethostname()
+
+# 할당된 작업에서 워커가 사용하는 컬럼 (응답 크기 축소)
+_CLAIM_COLUMNS = (
+    "id",
+    "aep_project",
+    "aep_comp_name",
+    "output_format",
+    "output_path",
+    "gfx_data",
+    "error_details",
+)
+
+# 상태 변경 응답으로 받을 컬럼 (전체 행 대신 확인용 최소 컬럼)
+_STATUS_COLUMNS = ("id", "status")
+
+# update_job_status에서 갱신을 허용하는 컬럼
+_ALLOWED_UPDATE_COLUMNS = frozenset(
+    {
+        "progress",
+        "current_frame",
+        "total_frames",
+        "error_message",
+        "error_details",
+        "error_frame",
+        "output_path",
+        "output_file_size",
+        "output_duration_seconds",
+        "render_duration_ms",
+        "completed_at",
+        "started_at",
+        "metadata",
+        "worker_id",
+        "worker_host",
+        "aerender_pid",
+        "cache_hit",
+        "cached_output_path",
+        "estimated_completion",
+    }
+)
+
+# 대기 작업 수 캐시 기본 유효 시간 (초, 헬스체크 스크레이프마다 COUNT 방지)
+_PENDING_COUNT_TTL = 5.0
+
 
 class SupabaseQueueClient:
     """Supabase render_queue 클라이언트 (기존 스키마 호환)"""
 
     def __init__(self, config: WorkerConfig):
         self.config = config
-        self.client: Client = create_client(
-            config.supabase_url, config.supabase_service_key
+        self.client: Client = create_client(config.supabase_url, config.supabase_service_key)
+        self.worker_host = _HOSTNAME
+        self._realtime: "AsyncRealtimeClient | None" = None
+        # 대기 작업 수 캐시: (조회 시각 monotonic, 개수)
+        self._pending_count: tuple[float, int] | None = None
+
+    async def _execute(self, query: Any) -> Any:
+        """동기 supabase-py 요청을 스레드에서 실행 (이벤트 루프 블로킹 방지)
+
+        Args:
+            query: execute()를 호출할 PostgREST 쿼리/RPC 빌더
+
+        Returns:
+            PostgREST 응답
+        """
+        return await asyncio.to_thread(query.execute)
+
+    async def subscribe_new_jobs(self, on_new_job: Callable[[], None]) -> bool:
+        """pending 작업 INSERT 알림 구독 (Supabase Realtime)
+
+        render_queue가 supabase_realtime publication에 포함되어 있어야 합니다
+        (migrations/006).
+
+        Args:
+            on_new_job: 새 pending 작업이 INSERT될 때 호출할 콜백
+
+        Returns:
+            bool: 구독 성공 여부 (실패 시 호출자는 폴링만 사용)
+        """
+        if AsyncRealtimeClient is None:
+            logger.warning("[Supabase] realtime 패키지 없음, 폴링만 사용")
+            return False
+
+        realtime = AsyncRealtimeClient(
+            f"{self.config.supabase_url}/realtime/v1",
+            token=self.config.supabase_service_key,
+            params={"apikey": self.config.supabase_service_key},
         )
-        self.worker_host = socket.gethostname()
+        try:
+            await realtime.connect()
+            channel = realtime.channel("render_queue_new_job")
+            channel.on_postgres_changes(
+                "INSERT",
+                lambda _payload: on_new_job(),
+                table="render_queue",
+                filter=f"status=eq.{RenderStatus.PENDING.value}",
+            )
+            await channel.subscribe()
+        except Exception as e:
+            logger.warning(f"[Supabase] Realtime 구독 실패, 폴링만 사용: {e}")
+            await realtime.close()
+            return False
+
+        self._realtime = realtime
+        return True
+
+    async def close(self) -> None:
+        """Realtime 연결 종료 (구독하지 않았으면 no-op)"""
+        if self._realtime is not None:
+            realtime, self._realtime = self._realtime, None
+            await realtime.close()
 
     async def claim_pending_job(self, worker_id: str) -> dict[str, Any] | None:
         """
         대기 중인 작업을 할당
 
-        기존 스키마에 claim_render_job RPC가 없으므로
-        SELECT → UPDATE 방식으로 처리.
+        claim_pending_render_job RPC가 가장 높은 우선순위의 pending 작업을
+        FOR UPDATE SKIP LOCKED로 잠그고 preparing으로 변경합니다.
+        (1회 왕복, 워커 간 경합 없음)
 
         Args:
             worker_id: 워커 ID (TEXT)
@@ -38,47 +154,19 @@ class SupabaseQueueClient:
         Returns:
             할당된 작업 또는 None (대기 작업 없음)
         """
-        # 1. pending 상태의 가장 높은 우선순위 작업 조회
-        response = (
-            self.client.table("render_queue")
-            .select("id")
-            .eq("status", RenderStatus.PENDING.value)
-            .order("priority", desc=False)  # 낮은 숫자 = 높은 우선순위
-            .order("queued_at", desc=False)  # 오래된 것 먼저
-            .limit(1)
-            .execute()
-        )
-
-        if not response.data or len(response.data) == 0:
-            return None
-
-        job_id = response.data[0]["id"]
-
-        # 2. 작업 상태를 preparing으로 업데이트 (atomic하지 않지만 실용적)
-        update_response = (
-            self.client.table("render_queue")
-            .update(
-                {
-                    "status": RenderStatus.PREPARING.value,
-                    "worker_id": worker_id,
-                    "worker_host": self.worker_host,
-                    "started_at": datetime.now(timezone.utc).isoformat(),
-                }
-            )
-            .eq("id", job_id)
-            .eq("status", RenderStatus.PENDING.value)  # 동시성 보호
-            .execute()
+        response = await self._execute(
+            self.client.rpc(
+                "claim_pending_render_job",
+                {"p_worker_id": worker_id, "p_worker_host": self.worker_host},
+            ).select(*_CLAIM_COLUMNS)
         )
 
-        if update_response.data and len(update_response.data) > 0:
-            return update_response.data[0]
+        if response.data:
+            return response.data[0]
 
-        # 다른 워커가 먼저 가져간 경우
         return None
 
-    async def update_job_status(
-        self, job_id: str, status: str, **kwargs
-    ) -> dict[str, Any]:
+    async def update_job_status(self, job_id: str, status: str, **kwargs) -> dict[str, Any]:
         """
         작업 상태 업데이트
 
@@ -100,42 +188,20 @@ class SupabaseQueueClient:
                 - worker_id (str | None): 워커 ID
 
         Returns:
-            업데이트된 작업 레코드
+            업데이트된 작업의 id/status
         """
         update_data: dict[str, Any] = {"status": status}
 
         # 허용 컬럼만 필터링
-        allowed_columns = {
-            "progress",
-            "current_frame",
-            "total_frames",
-            "error_message",
-            "error_details",
-            "error_frame",
-            "output_path",
-            "output_file_size",
-            "output_duration_seconds",
-            "render_duration_ms",
-            "completed_at",
-            "started_at",
-            "metadata",
-            "worker_id",
-            "worker_host",
-            "aerender_pid",
-            "cache_hit",
-            "cached_output_path",
-            "estimated_completion",
-        }
-
         for key, value in kwargs.items():
-            if key in allowed_columns:
+            if key in _ALLOWED_UPDATE_COLUMNS:
                 update_data[key] = value
 
-        response = (
+        response = await self._execute(
             self.client.table("render_queue")
             .update(update_data)
             .eq("id", job_id)
-            .execute()
+            .select(*_STATUS_COLUMNS)
         )
 
         if response.data and len(response.data) > 0:
@@ -149,31 +215,54 @@ class SupabaseQueueClient:
         progress: int,
         current_frame: int | None = None,
         nexrender_state: str | None = None,
+        status: str | None = None,
     ) -> None:
         """
         진행률 업데이트 (간편 메서드)
 
+        status를 함께 전달하면 진행률과 상태를 한 번의 UPDATE로 반영합니다.
+
         Args:
             job_id: 작업 ID
             progress: 진행률 (0-100)
             current_frame: 현재 프레임
             nexrender_state: Nexrender 상태
+            status: 새 상태 (orch_render_status enum 값, 선택)
         """
         update_data: dict[str, Any] = {"progress": progress}
 
+        if status is not None:
+            update_data["status"] = status
+
         if current_frame is not None:
             update_data["current_frame"] = current_frame
 
-        # nexrender_state는 metadata에 저장
+        # 응답 본문 불필요 (Prefer: return=minimal)
+        update = self._execute(
+            self.client.table("render_queue")
+            .update(update_data, returning=ReturnMethod.minimal)
+            .eq("id", job_id)
+        )
+
+        # nexrender_state는 metadata에 병합 (조회 없이 원자적 갱신)
+        # 서로 다른 컬럼이므로 진행률 UPDATE와 동시에 전송
         if nexrender_state:
-            # 기존 metadata 조회
-            job = await self.get_job(job_id)
-            if job:
-                metadata = job.get("metadata", {}) or {}
-                metadata["nexrender_state"] = nexrender_state
-                update_data["metadata"] = metadata
+            await asyncio.gather(
+                update, self._merge_metadata(job_id, {"nexrender_state": nexrender_state})
+            )
+        else:
+            await update
 
-        self.client.table("render_queue").update(update_data).eq("id", job_id).execute()
+    async def _merge_metadata(self, job_id: str, patch: dict[str, Any]) -> None:
+        """metadata JSONB에 patch 병합 (merge_render_job_metadata RPC)
+
+        Args:
+            job_id: 작업 ID
+            patch: 병합할 키/값
+        """
+        await self._execute(
+            self.client.rpc("merge_render_job_metadata", {"p_job_id": job_id, "p_patch": patch})
+        )
 
     async def set_nexrender_job_id(self, job_id: str, nexrender_job_id: str) -> None:
         """
@@ -183,13 +272,7 @@ class SupabaseQueueClient:
             job_id: 작업 ID
             nexrender_job_id: Nexrender Job UID
         """
-        job = await self.get_job(job_id)
-        if job:
-            metadata = job.get("metadata", {}) or {}
-            metadata["nexrender_job_id"] = nexrender_job_id
-            self.client.table("render_queue").update({"metadata": metadata}).eq(
-                "id", job_id
-            ).execute()
+        await self._merge_metadata(job_id, {"nexrender_job_id": nexrender_job_id})
 
     async def mark_completed(
         self,
@@ -221,10 +304,19 @@ class SupabaseQueueClient:
         if render_duration_ms is not None:
             update_data["render_duration_ms"] = render_duration_ms
 
-        return await self.update_job_status(
-            job_id, RenderStatus.COMPLETED.value, **update_data
+        # 컬럼이 확정되어 있으므로 update_job_status의 필터링 없이 직접 UPDATE
+        response = await self._execute(
+            self.client.table("render_queue")
+            .update(update_data)
+            .eq("id", job_id)
+            .select(*_STATUS_COLUMNS)
         )
 
+        if response.data:
+            return response.data[0]
+
+        raise ValueError(f"작업 업데이트 실패: {job_id}")
+
     async def mark_failed(
         self,
         job_id: str,
@@ -241,41 +333,24 @@ class SupabaseQueueClient:
             error_category: 에러 카테고리 (retryable, non_retryable, unknown)
             should_retry: 재시도 여부 (True면 pending으로 복원)
         """
-        # 기존 error_details 조회
-        job = await self.get_job(job_id)
-        error_details: dict[str, Any] = {}
-        if job:
-            error_details = job.get("error_details", {}) or {}
-
-        # retry_count 증가
-        retry_count = error_details.get("retry_count", 0) + 1
-        max_retries = error_details.get("max_retries", 3)
-
-        error_details["retry_count"] = retry_count
-        error_details["max_retries"] = max_retries
-        error_details["error_category"] = error_category
-        error_details["last_error_at"] = datetime.now(timezone.utc).isoformat()
-
-        # 재시도 가능하고 한도 미달이면 pending으로
-        if should_retry and retry_count < max_retries:
-            return await self.update_job_status(
-                job_id,
-                RenderStatus.PENDING.value,
-                error_message=error_message,
-                error_details=error_details,
-                worker_id=None,
-            )
-
-        # 최종 실패
-        return await self.update_job_status(
-            job_id,
-            RenderStatus.FAILED.value,
-            error_message=error_message,
-            error_details=error_details,
-            completed_at=datetime.now(timezone.utc).isoformat(),
-            worker_id=None,
+        # retry_count 증가 및 pending/failed 결정은 fail_render_job RPC에서 원자적으로 처리
+        response = await self._execute(
+            self.client.rpc(
+                "fail_render_job",
+                {
+                    "p_job_id": job_id,
+                    "p_error_message": error_message,
+                    "p_error_category": error_category,
+                    "p_should_retry": should_retry,
+                },
+            ).select(*_STATUS_COLUMNS)
         )
 
+        if response.data:
+            return response.data[0]
+
+        raise ValueError(f"작업 업데이트 실패: {job_id}")
+
     async def release_job(self, job_id: str) -> None:
         """
         작업 락 해제 (pending으로 복원)
@@ -285,24 +360,8 @@ class SupabaseQueueClient:
         Args:
             job_id: 작업 ID
         """
-        # 기존 error_details 조회
-        job = await self.get_job(job_id)
-        error_details: dict[str, Any] = {}
-        if job:
-            error_details = job.get("error_details", {}) or {}
-
-        recovery_count = error_details.get("recovery_count", 0)
-        error_details["recovery_count"] = recovery_count + 1
-        error_details["last_recovery_at"] = datetime.now(timezone.utc).isoformat()
-
-        # pending으로 복원
-        self.client.table("render_queue").update(
-            {
-                "status": RenderStatus.PENDING.value,
-                "worker_id": None,
-                "error_details": error_details,
-            }
-        ).eq("id", job_id).execute()
+        # recovery_count 증가 및 pending 복원 (release_render_job RPC)
+        await self._execute(self.client.rpc("release_render_job", {"p_job_id": job_id}))
 
     async def get_job(self, job_id: str) -> dict[str, Any] | None:
         """
@@ -314,8 +373,8 @@ class SupabaseQueueClient:
         Returns:
             작업 레코드 또는 None
         """
-        response = (
-            self.client.table("render_queue").select("*").eq("id", job_id).execute()
+        response = await self._execute(
+            self.client.table("render_queue").select("*").eq("id", job_id)
         )
 
         if response.data and len(response.data) > 0:
@@ -323,12 +382,26 @@ class SupabaseQueueClient:
 
         return None
 
-    async def get_pending_count(self) -> int:
-        """대기 중인 작업 수 조회"""
-        response = (
+    async def get_pending_count(self, max_age: float = _PENDING_COUNT_TTL) -> int:
+        """대기 중인 작업 수 조회
+
+        Args:
+            max_age: 캐시된 값을 재사용할 최대 경과 시간 (초, 0이면 항상 조회)
+
+        Returns:
+            pending 상태 작업 수
+        """
+        now = time.monotonic()
+        if self._pending_count is not None:
+            counted_at, count = self._pending_count
+            if now - counted_at < max_age:
+                return count
+
+        response = await self._execute(
             self.client.table("render_queue")
             .select("id", count="exact")
             .eq("status", RenderStatus.PENDING.value)
-            .execute()
         )
-        return response.count or 0
+        count = response.count or 0
+        self._pending_count = (now, count)
+        return count